@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Synthetic-scale benchmark for the landing data pipeline.
+
+Generates synthetic catalogs, event streams and canned App Store Lookup
+responses (served by a local stand-in HTTP server), then measures:
+- compile_catalog
+- ensure_bootstrap_data
+- apply_catalog_defaults (per entry)
+- update_from_event (per event, p50/p99 + throughput)
+- update_from_app_store (reconcile against the local Lookup stand-in)
+
+Each catalog size runs in its own subprocess so peak RSS is per size.
+
+Usage:
+  python3 landing-automation/benchmarks/bench_landing_pipeline.py
+  python3 landing-automation/benchmarks/bench_landing_pipeline.py --sizes 10,1000 --events 500
+  python3 landing-automation/benchmarks/bench_landing_pipeline.py --save-baseline main
+  python3 landing-automation/benchmarks/bench_landing_pipeline.py --compare main
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent / "scripts"
+BASELINE_DIR = BENCH_DIR / "baselines"
+DEFAULT_SIZES = "10,1000,10000"
+STATUSES = (
+    "WAITING_FOR_REVIEW",
+    "IN_REVIEW",
+    "PENDING_DEVELOPER_RELEASE",
+    "READY_FOR_SALE",
+    "REJECTED",
+)
+CATEGORIES = ("health", "camera", "voice", "sound")
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import update_landing_data as landing  # noqa: E402
+
+
+def synthetic_catalog(size: int, rng: random.Random) -> dict[str, Any]:
+    apps = []
+    for index in range(size):
+        slug = f"app{index:05d}"
+        apps.append(
+            {
+                "slug": slug,
+                "name": f"App {index}",
+                "name_ja": f"アプリ{index}",
+                "category": rng.choice(CATEGORIES),
+                "category_label": "Health",
+                "description_ja": "体重計のディスプレイをカメラで撮るだけ。" * 2,
+                "description_en": "Capture a reading and save it to Apple HealthKit." * 2,
+                "icon_path": f"{slug}-icon.png",
+                "fallback_image_path": f"{slug}-promo.png",
+                "card_image_path": f"assets/onboarding/{slug}-onboarding1.jpeg",
+                "input_methods": rng.choice([["camera_ocr", "voice_input"], ["voice"], "Camera + OCR", []]),
+                "support_path": f"{slug}/?lang=ja",
+                "app_store_url": f"https://apps.apple.com/app/{slug}/id{6700000000 + index}",
+                "bundle_id": f"jp.allnew.{slug}",
+                "asc_app_id": str(6700000000 + index),
+                "sort_order": index * 10,
+                "featured_priority": index + 1,
+                "bootstrap_visible": index % 3 != 0,
+            }
+        )
+    return {"schema_version": 1, "apps": apps}
+
+
+def synthetic_events(catalog: dict[str, Any], count: int, rng: random.Random) -> list[dict[str, Any]]:
+    apps = catalog["apps"]
+    events = []
+    for index in range(count):
+        app = rng.choice(apps)
+        payload: dict[str, Any] = {"status": rng.choice(STATUSES)}
+        # Exercise every slug resolution path.
+        key = rng.choice(("slug", "bundle_id", "asc_app_id"))
+        payload[key] = app[key]
+        if rng.random() < 0.3:
+            payload["input_methods"] = "camera / voice"
+        if rng.random() < 0.3:
+            payload["release_date"] = f"2026-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T00:00:00Z"
+        events.append(
+            {
+                "id": f"bench-{index}",
+                "client_payload": {
+                    "event_date": "2026-05-01T00:00:00Z",
+                    "app": payload,
+                },
+            }
+        )
+    return events
+
+
+def lookup_results(catalog: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    results = {}
+    for index, app in enumerate(catalog["apps"]):
+        if index % 7 == 0:
+            continue  # not public yet
+        results[app["asc_app_id"]] = {
+            "trackId": int(app["asc_app_id"]),
+            "bundleId": app["bundle_id"],
+            "trackViewUrl": app["app_store_url"],
+            "trackName": app["name"],
+            "version": "1.0.0",
+            "currentVersionReleaseDate": "2026-05-01T00:00:00Z",
+        }
+    return results
+
+
+def start_lookup_server(results: dict[str, dict[str, Any]]) -> ThreadingHTTPServer:
+    class LookupHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+            ids = ",".join(query.get("id", [""])).split(",")
+            items = [results[app_id] for app_id in ids if app_id in results]
+            body = json.dumps({"resultCount": len(items), "results": items}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LookupHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_size(size: int, event_count: int, seed: int) -> dict[str, Any]:
+    rng = random.Random(seed)
+    catalog = synthetic_catalog(size, rng)
+    events = synthetic_events(catalog, event_count, rng)
+    server = start_lookup_server(lookup_results(catalog))
+    landing.APP_STORE_LOOKUP_URL = f"http://127.0.0.1:{server.server_address[1]}/lookup"
+
+    report: dict[str, Any] = {"size": size, "events": event_count}
+
+    started = time.perf_counter()
+    compiled = landing.compile_catalog(catalog)
+    report["compile_catalog_seconds"] = round(time.perf_counter() - started, 6)
+
+    started = time.perf_counter()
+    output = landing.ensure_bootstrap_data(catalog, {}, compiled=compiled)
+    report["bootstrap_seconds"] = round(time.perf_counter() - started, 6)
+
+    catalog_apps = catalog["apps"]
+    started = time.perf_counter()
+    for app in catalog_apps:
+        landing.apply_catalog_defaults({}, app, compiled.defaults[app["slug"]])
+    elapsed = time.perf_counter() - started
+    report["apply_catalog_defaults_us_per_entry"] = round(elapsed / max(1, len(catalog_apps)) * 1e6, 3)
+
+    state: dict[str, Any] = {"schema_version": 1, "statuses": {}}
+    processed_index = landing.ProcessedEventIndex.from_state(state)
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for event in events:
+        event_started = time.perf_counter()
+        output, state = landing.update_from_event(
+            catalog,
+            state,
+            output,
+            event,
+            screenshot_workers=1,
+            processed_index=processed_index,
+            compiled=compiled,
+        )
+        latencies.append(time.perf_counter() - event_started)
+    elapsed = time.perf_counter() - started
+    report["event_throughput_per_second"] = round(event_count / elapsed, 3) if elapsed else 0.0
+    report["event_p50_ms"] = round(percentile(latencies, 0.50) * 1000, 3)
+    report["event_p99_ms"] = round(percentile(latencies, 0.99) * 1000, 3)
+
+    started = time.perf_counter()
+    landing.update_from_app_store(catalog, state, output, "jp", cache_dir=None, compiled=compiled)
+    report["reconcile_seconds"] = round(time.perf_counter() - started, 6)
+
+    server.shutdown()
+    report["peak_rss_mib"] = round(peak_rss_mib(), 1)
+    return report
+
+
+def run_isolated(size: int, event_count: int, seed: int) -> dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, __file__, "--worker-size", str(size), "--events", str(event_count), "--seed", str(seed)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare(current: list[dict[str, Any]], baseline: list[dict[str, Any]]) -> None:
+    baseline_by_size = {item["size"]: item for item in baseline}
+    for item in current:
+        base = baseline_by_size.get(item["size"])
+        if not base:
+            continue
+        for key, value in item.items():
+            if key in {"size", "events"} or not isinstance(value, (int, float)):
+                continue
+            previous = base.get(key)
+            if not previous:
+                continue
+            delta = (value - previous) / previous * 100
+            print(f"size={item['size']:>6} {key:<40} {previous:>12} -> {value:>12} ({delta:+.1f}%)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the landing data pipeline at synthetic scale")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated catalog sizes")
+    parser.add_argument("--events", type=int, default=100, help="Events applied per catalog size")
+    parser.add_argument("--seed", type=int, default=20260517)
+    parser.add_argument("--save-baseline", default="", help="Save results as baselines/<name>.json")
+    parser.add_argument("--compare", default="", help="Compare results with baselines/<name>.json")
+    parser.add_argument("--worker-size", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker_size:
+        # Keep stdout machine-readable: the updater's progress prints go to stderr.
+        sys.stdout, real_stdout = sys.stderr, sys.stdout
+        report = run_size(args.worker_size, args.events, args.seed)
+        real_stdout.write(json.dumps(report) + "\n")
+        return 0
+
+    sizes = [int(item) for item in args.sizes.split(",") if item.strip()]
+    results = []
+    for size in sizes:
+        report = run_isolated(size, args.events, args.seed)
+        results.append(report)
+        print(json.dumps(report, ensure_ascii=False))
+
+    if args.compare:
+        baseline_path = BASELINE_DIR / f"{args.compare}.json"
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        compare(results, baseline.get("results", []))
+
+    if args.save_baseline:
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        baseline_path = BASELINE_DIR / f"{args.save_baseline}.json"
+        payload = {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "events": args.events,
+            "seed": args.seed,
+            "results": results,
+        }
+        baseline_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"[INFO] saved baseline: {baseline_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
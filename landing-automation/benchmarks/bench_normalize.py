@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the memoized normalization helpers.
+
+Replays a realistic mix of status names, release dates and input-method
+strings through the cached helpers and through their uncached bodies
+(``__wrapped__``), and reports ns/call plus cache hit rates.
+
+Usage:
+  python3 landing-automation/benchmarks/bench_normalize.py
+  python3 landing-automation/benchmarks/bench_normalize.py --calls 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent / "scripts"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import landing_normalize as normalize  # noqa: E402
+
+STATUSES = (
+    "WAITING_FOR_REVIEW",
+    "IN_REVIEW",
+    "PENDING_DEVELOPER_RELEASE",
+    "READY_FOR_SALE",
+    "REJECTED",
+    "PREPARE_FOR_SUBMISSION",
+)
+METHODS = ("camera / voice", "Camera + OCR", "voice_input,sound", "ar-camera", "speech")
+
+
+def synthetic_inputs(calls: int, rng: random.Random) -> dict[str, list[Any]]:
+    dates = [f"2026-{month:02d}-{day:02d}T10:00:00Z" for month in range(1, 13) for day in range(1, 29)]
+    return {
+        "status": [rng.choice(STATUSES) for _ in range(calls)],
+        "release_date": [rng.choice(dates) for _ in range(calls)],
+        "method_text": [rng.choice(METHODS) for _ in range(calls)],
+        "method_list": [list(rng.sample(("camera", "voice", "sound", "camera_ar"), 2)) for _ in range(calls)],
+    }
+
+
+def time_calls(function: Callable[[Any], Any], values: list[Any]) -> float:
+    started = time.perf_counter()
+    for value in values:
+        function(value)
+    return (time.perf_counter() - started) / max(1, len(values)) * 1e9
+
+
+def uncached_parse_input_methods(value: Any) -> list[str]:
+    if isinstance(value, list):
+        return list(normalize._normalize_method_tuple.__wrapped__(tuple(value)))
+    return list(normalize._parse_method_text.__wrapped__(value.strip()))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the memoized normalization helpers")
+    parser.add_argument("--calls", type=int, default=200000, help="Calls per helper")
+    parser.add_argument("--seed", type=int, default=20260517)
+    args = parser.parse_args()
+
+    inputs = synthetic_inputs(args.calls, random.Random(args.seed))
+    cases = {
+        "status": (normalize.normalize_status, normalize._normalize_status_text.__wrapped__),
+        "release_date": (normalize.normalize_release_date, normalize._normalize_release_date_text.__wrapped__),
+        "method_text": (normalize.parse_input_methods, uncached_parse_input_methods),
+        "method_list": (normalize.parse_input_methods, uncached_parse_input_methods),
+    }
+    for name, (cached, uncached) in cases.items():
+        values = inputs[name]
+        uncached_ns = time_calls(uncached, values)
+        cached_ns = time_calls(cached, values)
+        report = {
+            "helper": name,
+            "calls": len(values),
+            "uncached_ns_per_call": round(uncached_ns, 1),
+            "cached_ns_per_call": round(cached_ns, 1),
+            "speedup": round(uncached_ns / cached_ns, 2) if cached_ns else 0.0,
+        }
+        print(json.dumps(report))
+    print(json.dumps({"cache_info": normalize.normalize_cache_info()}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
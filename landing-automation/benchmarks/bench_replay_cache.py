@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the webhook relay's replay cache.
+
+Registers a flood of unique event ids with a sprinkling of duplicates, first
+through the previous dict-plus-full-scan approach and then through
+``ReplayCache``, and reports ns/call, final size and the cache counters.
+
+Usage:
+  python3 landing-automation/benchmarks/bench_replay_cache.py
+  python3 landing-automation/benchmarks/bench_replay_cache.py --events 200000 --capacity 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+RELAY_DIR = BENCH_DIR.parent / "webhook-relay"
+
+sys.path.insert(0, str(RELAY_DIR))
+
+from asc_webhook_relay import ReplayCache  # noqa: E402
+
+
+def scan_register(cache: dict[str, float], event_id: str, ttl_seconds: int) -> bool:
+    now = time.time()
+    expired = [key for key, expires_at in cache.items() if expires_at <= now]
+    for key in expired:
+        cache.pop(key, None)
+    existing_expires = cache.get(event_id)
+    if existing_expires and existing_expires > now:
+        return False
+    cache[event_id] = now + ttl_seconds
+    return True
+
+
+def synthetic_event_ids(count: int, duplicate_rate: float, rng: random.Random) -> list[str]:
+    event_ids: list[str] = []
+    for index in range(count):
+        if event_ids and rng.random() < duplicate_rate:
+            event_ids.append(rng.choice(event_ids[-1000:]))
+        else:
+            event_ids.append(f"evt-{index:08d}")
+    return event_ids
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the relay replay cache")
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--scan-events", type=int, default=5000, help="Events for the O(n) baseline")
+    parser.add_argument("--capacity", type=int, default=20000)
+    parser.add_argument("--ttl", type=int, default=3600)
+    parser.add_argument("--duplicate-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=20260517)
+    args = parser.parse_args()
+
+    event_ids = synthetic_event_ids(args.events, args.duplicate_rate, random.Random(args.seed))
+
+    baseline: dict[str, float] = {}
+    scan_ids = event_ids[: args.scan_events]
+    started = time.perf_counter()
+    for event_id in scan_ids:
+        scan_register(baseline, event_id, args.ttl)
+    scan_ns = (time.perf_counter() - started) / max(1, len(scan_ids)) * 1e9
+    print(json.dumps({"impl": "dict_scan", "events": len(scan_ids), "ns_per_call": round(scan_ns, 1), "size": len(baseline)}))
+
+    cache = ReplayCache(args.capacity)
+    started = time.perf_counter()
+    for event_id in event_ids:
+        cache.register(event_id, args.ttl)
+    cache_ns = (time.perf_counter() - started) / max(1, len(event_ids)) * 1e9
+    print(json.dumps({"impl": "replay_cache", "events": len(event_ids), "ns_per_call": round(cache_ns, 1), **cache.stats()}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
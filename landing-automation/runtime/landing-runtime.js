@@ -17,6 +17,8 @@
     pet: { gridId: 'pet-grid', tag: 'Pet' },
     productivity: { gridId: 'productivity-grid', tag: 'Productivity' }
   };
+  // Rendered width of card / featured screenshots, used to pick a srcset candidate.
+  const PROMO_IMAGE_SIZES = '(max-width: 640px) 45vw, 240px';
   let cachedPayload = null;
   let currentLang = 'ja';
 
@@ -80,6 +82,12 @@
     return isExternalPath(path) ? path : path.replace(/^\.\//, '');
   }
 
+  // The srcset must describe the image actually shown: card_image_path wins over the ASC screenshot.
+  function pickPromoSrcset(app) {
+    if (app.card_image_path) return app.card_image_srcset || null;
+    return app.promo_image_srcset || null;
+  }
+
   function normalizeVisibleApps(apps) {
     return (apps || [])
       .filter(function (app) {
@@ -184,6 +192,7 @@
   function buildWorkCard(app, fallbackTag) {
     const supportPath = resolveSupportPath(app);
     const promoImage = normalizeImagePath(app.card_image_path || app.promo_image_path);
+    const promoSrcset = pickPromoSrcset(app);
     const iconPath = normalizeImagePath(app.icon_path);
     const baseTag = buildInputMethodLabel(app, fallbackTag);
     const statusTag = app.status === 'submitted' ? (currentLang === 'en' ? 'In Review' : '審査中') : '';
@@ -192,9 +201,20 @@
     return [
       '<a class="work-card visible" href="' + safeText(supportPath) + '">',
       '  <div class="work-card-img" style="background:#f5f5f5;">',
-      promoImage
-        ? '    <img src="' + safeText(promoImage) + '" alt="' + safeText(app.name) + '" loading="lazy">'
-        : '',
+      promoImage && promoSrcset
+        ? [
+          '    <picture>',
+          promoSrcset['image/webp']
+            ? '      <source type="image/webp" srcset="' + safeText(promoSrcset['image/webp']) + '" sizes="' + PROMO_IMAGE_SIZES + '">'
+            : '',
+          '      <img src="' + safeText(promoImage) + '"' +
+            (promoSrcset['image/jpeg'] ? ' srcset="' + safeText(promoSrcset['image/jpeg']) + '" sizes="' + PROMO_IMAGE_SIZES + '"' : '') +
+            ' alt="' + safeText(app.name) + '" loading="lazy">',
+          '    </picture>'
+        ].join('\n')
+        : promoImage
+          ? '    <img src="' + safeText(promoImage) + '" alt="' + safeText(app.name) + '" loading="lazy">'
+          : '',
       '  </div>',
       '  <div class="work-card-body">',
       '    <div class="work-card-meta">',
@@ -289,6 +309,14 @@
     const imageEl = document.getElementById('featured-image');
     const imagePath = normalizeImagePath(app.card_image_path || app.promo_image_path);
     if (imageEl && imagePath) {
+      const promoSrcset = pickPromoSrcset(app);
+      if (promoSrcset && promoSrcset['image/jpeg']) {
+        imageEl.srcset = promoSrcset['image/jpeg'];
+        imageEl.sizes = PROMO_IMAGE_SIZES;
+      } else {
+        imageEl.removeAttribute('srcset');
+        imageEl.removeAttribute('sizes');
+      }
       imageEl.src = imagePath;
       imageEl.alt = app.name;
     }
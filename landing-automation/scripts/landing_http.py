@@ -0,0 +1,240 @@
+"""Pooled keep-alive HTTP client shared by the landing updater's outbound fetches.
+
+``urllib.request.urlopen`` opens a fresh connection (DNS, TCP and TLS) per
+request. ``HttpClient`` keeps idle connections per scheme/host/port and reuses
+them, caps concurrent requests per host, and retries connection failures and
+retryable statuses with exponential backoff and full jitter.
+
+Errors are raised as ``urllib.error.HTTPError`` (any non-2xx final status,
+including 304) and ``urllib.error.URLError`` (connection failures, and body
+read failures in ``get``), so callers keep the same ``except`` clauses they
+used with ``urlopen``.
+"""
+
+from __future__ import annotations
+
+import http.client
+import io
+import random
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.parse
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+# Servers drop idle keep-alive sockets after a few seconds to a minute.
+IDLE_CONNECTION_TIMEOUT = 30.0
+# Errors that mean a reused keep-alive socket was already closed by the server.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+PoolKey = tuple[str, str, int]
+
+
+class HttpClient:
+    """Thread-safe client with per-host connection pools and concurrency limits."""
+
+    def __init__(
+        self,
+        *,
+        max_per_host: int = 6,
+        retries: int = 3,
+        backoff: float = 0.5,
+        backoff_max: float = 8.0,
+        user_agent: str = "allnew-landing-sync/1.0",
+    ) -> None:
+        self.max_per_host = max(1, max_per_host)
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.user_agent = user_agent
+        self.ssl_context = ssl.create_default_context()
+        self.idle: dict[PoolKey, list[tuple[http.client.HTTPConnection, float]]] = {}
+        self.limits: dict[PoolKey, threading.BoundedSemaphore] = {}
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "connections_opened": 0, "connections_reused": 0, "retries": 0}
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.stats[name] += 1
+
+    def host_limit(self, key: PoolKey) -> threading.BoundedSemaphore:
+        with self.lock:
+            limit = self.limits.get(key)
+            if limit is None:
+                limit = threading.BoundedSemaphore(self.max_per_host)
+                self.limits[key] = limit
+            return limit
+
+    def checkout(self, key: PoolKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with self.lock:
+            pool = self.idle.get(key, [])
+            while pool:
+                connection, idle_since = pool.pop()
+                if now - idle_since < IDLE_CONNECTION_TIMEOUT:
+                    self.stats["connections_reused"] += 1
+                    connection.timeout = timeout
+                    if connection.sock is not None:
+                        connection.sock.settimeout(timeout)
+                    return connection, True
+                connection.close()
+            self.stats["connections_opened"] += 1
+        return self.new_connection(key, timeout), False
+
+    def new_connection(self, key: PoolKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def checkin(self, key: PoolKey, connection: http.client.HTTPConnection) -> None:
+        with self.lock:
+            pool = self.idle.setdefault(key, [])
+            if len(pool) < self.max_per_host:
+                pool.append((connection, time.monotonic()))
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self.lock:
+            pools, self.idle = self.idle, {}
+        for pool in pools.values():
+            for connection, _idle_since in pool:
+                connection.close()
+
+    def retry_delay(self, attempt: int, retry_after: str | None = None) -> float:
+        delay = random.uniform(0, min(self.backoff_max, self.backoff * (2**attempt)))
+        if retry_after and retry_after.strip().isdigit():
+            delay = max(delay, float(retry_after))
+        return min(delay, self.backoff_max)
+
+    def send(
+        self,
+        key: PoolKey,
+        target: str,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        connection, reused = self.checkout(key, timeout)
+        try:
+            connection.request("GET", target, headers=headers)
+            return connection, connection.getresponse()
+        except STALE_CONNECTION_ERRORS:
+            connection.close()
+            if not reused:
+                raise
+        except BaseException:
+            connection.close()
+            raise
+        # The pooled socket had gone away; one immediate retry on a fresh connection.
+        with self.lock:
+            self.stats["connections_opened"] += 1
+        connection = self.new_connection(key, timeout)
+        try:
+            connection.request("GET", target, headers=headers)
+            return connection, connection.getresponse()
+        except BaseException:
+            connection.close()
+            raise
+
+    @contextmanager
+    def open(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float = 30,
+        validate_url: Callable[[str], str] | None = None,
+    ) -> Iterator[http.client.HTTPResponse]:
+        """GET ``url`` and yield the 2xx response for streaming reads.
+
+        Redirects are followed manually (up to MAX_REDIRECTS) and every target
+        is re-checked with ``validate_url`` when given. The connection returns
+        to the pool only if the body was read to the end.
+        """
+        request_headers = {"User-Agent": self.user_agent, **(headers or {})}
+        attempt = 0
+        redirects = 0
+        while True:
+            parsed = urllib.parse.urlsplit(url)
+            scheme = parsed.scheme.lower()
+            if scheme not in {"http", "https"} or not parsed.hostname:
+                raise urllib.error.URLError(f"unsupported URL: {url}")
+            key = (scheme, parsed.hostname.lower(), parsed.port or (443 if scheme == "https" else 80))
+            target = urllib.parse.urlunsplit(("", "", parsed.path or "/", parsed.query, ""))
+
+            limit = self.host_limit(key)
+            limit.acquire()
+            try:
+                self.count("requests")
+                try:
+                    connection, response = self.send(key, target, request_headers, timeout)
+                except (OSError, http.client.HTTPException) as error:
+                    if attempt < self.retries:
+                        self.count("retries")
+                        time.sleep(self.retry_delay(attempt))
+                        attempt += 1
+                        continue
+                    raise urllib.error.URLError(error) from error
+
+                status = response.status
+                if 200 <= status < 300:
+                    try:
+                        yield response
+                    except BaseException:
+                        connection.close()
+                        raise
+                    if response.isclosed() and not response.will_close:
+                        self.checkin(key, connection)
+                    else:
+                        connection.close()
+                    return
+
+                # Drain small error/redirect bodies so the connection can be reused.
+                body = response.read()
+                if response.will_close:
+                    connection.close()
+                else:
+                    self.checkin(key, connection)
+            finally:
+                limit.release()
+
+            location = response.headers.get("Location")
+            if status in REDIRECT_STATUSES and location:
+                redirects += 1
+                if redirects > MAX_REDIRECTS:
+                    raise urllib.error.URLError(f"too many redirects: {url}")
+                next_url = urllib.parse.urljoin(url, location)
+                url = validate_url(next_url) if validate_url else next_url
+                continue
+
+            if status in RETRYABLE_STATUSES and attempt < self.retries:
+                self.count("retries")
+                time.sleep(self.retry_delay(attempt, response.headers.get("Retry-After")))
+                attempt += 1
+                continue
+
+            raise urllib.error.HTTPError(url, status, response.reason, response.headers, io.BytesIO(body))
+
+    def get(self, url: str, **kwargs: Any) -> bytes:
+        """GET ``url`` and return the whole body.
+
+        A connection reset or truncated body while reading is raised as
+        ``URLError`` like a failure before the response started.
+        """
+        with self.open(url, **kwargs) as response:
+            try:
+                return response.read()
+            except (OSError, http.client.HTTPException) as error:
+                raise urllib.error.URLError(error) from error
+
@@ -0,0 +1,122 @@
+"""Responsive derivatives for downloaded App Store screenshots.
+
+Each screenshot is resized to a few widths and encoded as WebP and JPEG,
+stepping the quality down until the file fits the byte budget for its width.
+Derivatives are named by the source content hash, so an unchanged or shared
+screenshot reuses the files already on disk. Pillow is optional: without it
+no derivatives are produced and entries keep only ``promo_image_path``.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Any
+
+try:
+    from PIL import Image, ImageOps  # type: ignore[import-not-found]
+except ImportError:  # optional: only needed for responsive derivatives
+    Image = None
+    ImageOps = None
+
+DERIVATIVE_FORMATS = {
+    "image/webp": ("WEBP", ".webp"),
+    "image/jpeg": ("JPEG", ".jpg"),
+}
+QUALITY_STEPS = (82, 74, 66, 58, 50, 42)
+# Decoding failures to report and skip; DecompressionBombError is not an OSError.
+DERIVATIVE_ERRORS: tuple[type[Exception], ...] = (OSError, ValueError)
+if Image is not None:
+    DERIVATIVE_ERRORS += (Image.DecompressionBombError,)
+DEFAULT_BYTE_BUDGETS = "320:40000,640:100000,960:180000"
+
+
+def derivatives_available() -> bool:
+    return Image is not None
+
+
+def parse_byte_budgets(value: str) -> dict[int, int]:
+    """Parse ``"320:40000,640:100000"`` into ``{width: max_bytes}``."""
+    budgets: dict[int, int] = {}
+    for item in value.split(","):
+        text = item.strip()
+        if not text:
+            continue
+        width, _, budget = text.partition(":")
+        if not width.strip().isdigit() or not budget.strip().isdigit():
+            raise ValueError(f"invalid derivative budget: {text!r} (expected WIDTH:BYTES)")
+        budgets[int(width)] = int(budget)
+    return dict(sorted(budgets.items()))
+
+
+def encode_within_budget(image: Any, image_format: str, budget: int) -> tuple[bytes, int]:
+    data = b""
+    quality = QUALITY_STEPS[0]
+    for quality in QUALITY_STEPS:
+        buffer = io.BytesIO()
+        if image_format == "WEBP":
+            image.save(buffer, format=image_format, quality=quality, method=6)
+        else:
+            image.save(buffer, format=image_format, quality=quality, optimize=True, progressive=True)
+        data = buffer.getvalue()
+        if len(data) <= budget:
+            break
+    return data, quality
+
+
+def build_derivatives(
+    source: Path,
+    target_dir: Path,
+    stem: str,
+    budgets: dict[int, int],
+) -> list[dict[str, Any]]:
+    """Write ``<stem>-<width>w.<ext>`` files and return ``[{type, path, width, bytes}]``.
+
+    Widths at or above the source width are skipped; a source narrower than
+    every configured width gets a single derivative at its own width.
+    """
+    if Image is None or not budgets:
+        return []
+
+    derivatives: list[dict[str, Any]] = []
+    with Image.open(source) as opened:
+        source_width, source_height = opened.size
+        widths = [width for width in budgets if width < source_width] or [source_width]
+        planned = [
+            (width, mime, image_format, target_dir / f"{stem}-{width}w{extension}")
+            for width in widths
+            for mime, (image_format, extension) in DERIVATIVE_FORMATS.items()
+        ]
+
+        image = None
+        for width, mime, image_format, path in planned:
+            if not path.exists():
+                if image is None:
+                    image = ImageOps.exif_transpose(opened).convert("RGB")
+                budget = budgets.get(width, budgets[min(budgets)])
+                height = max(1, round(source_height * width / source_width))
+                resized = image.resize((width, height), Image.Resampling.LANCZOS)
+                data, quality = encode_within_budget(resized, image_format, budget)
+                if len(data) > budget:
+                    print(
+                        f"[WARN] {path.name} is {len(data)} bytes at quality {quality}, "
+                        f"over its {budget} byte budget"
+                    )
+                target_dir.mkdir(parents=True, exist_ok=True)
+                temp_file = path.with_name(f".{path.name}.tmp")
+                temp_file.write_bytes(data)
+                temp_file.replace(path)
+            derivatives.append({"type": mime, "path": path, "width": width, "bytes": path.stat().st_size})
+    return derivatives
+
+
+def srcset_paths(srcset: dict[str, str]) -> list[str]:
+    return [candidate.strip().split(" ", 1)[0] for value in srcset.values() for candidate in value.split(",")]
+
+
+def srcset_by_type(derivatives: list[dict[str, Any]], root: Path) -> dict[str, str]:
+    srcset: dict[str, list[str]] = {}
+    for item in derivatives:
+        relative_path = item["path"].relative_to(root).as_posix()
+        srcset.setdefault(item["type"], []).append(f"{relative_path} {item['width']}w")
+    return {mime: ", ".join(candidates) for mime, candidates in srcset.items()}
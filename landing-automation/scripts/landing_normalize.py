@@ -0,0 +1,196 @@
+"""Normalization helpers shared by the landing updater.
+
+Status names, release dates and input-method codes come from a small set of
+distinct values, so the text paths are memoized with bounded LRU caches and
+their results are interned. Alias and label tables are built once at import.
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
+
+NORMALIZE_CACHE_SIZE = 4096
+
+INPUT_METHOD_LABELS = {
+    "camera_ocr": "Camera + OCR",
+    "voice_input": "Voice Input",
+    "sound_detection": "Sound Detection",
+    "camera_ar": "Camera + AR",
+}
+INPUT_METHOD_ALIASES = {
+    "camera": "camera_ocr",
+    "ocr": "camera_ocr",
+    "camera_ocr": "camera_ocr",
+    "voice": "voice_input",
+    "speech": "voice_input",
+    "voice_input": "voice_input",
+    "sound": "sound_detection",
+    "audio": "sound_detection",
+    "sound_detection": "sound_detection",
+    "camera_ar": "camera_ar",
+    "ar_camera": "camera_ar",
+}
+METHOD_SEPARATORS = str.maketrans({"&": "_", "/": "_", "-": "_", " ": "_", "+": "_"})
+STATE_SUBMITTED = {
+    "WAITING_FOR_REVIEW",
+    "IN_REVIEW",
+    "PENDING_DEVELOPER_RELEASE",
+    "PENDING_APPLE_RELEASE",
+    "PENDING_CONTRACT",
+    "PROCESSING_FOR_DISTRIBUTION",
+    "PREORDER_READY_FOR_SALE",
+}
+STATE_RELEASED = {
+    "READY_FOR_DISTRIBUTION",
+    "READY_FOR_SALE",
+}
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_status_text(raw_status: str) -> str:
+    upper = raw_status.upper()
+    if upper in STATE_RELEASED:
+        return "released"
+    if upper in STATE_SUBMITTED:
+        return "submitted"
+    if "REJECT" in upper:
+        return "rejected"
+    if "PREPARE" in upper or "DEVELOPER" in upper:
+        return "draft"
+    return "unknown"
+
+
+def normalize_status(raw_status: str | None) -> str:
+    if not raw_status:
+        return "unknown"
+    return _normalize_status_text(str(raw_status))
+
+
+def parse_iso_datetime(value: Any) -> datetime | None:
+    if not value:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        try:
+            return datetime.strptime(text, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+    normalized = text.replace("Z", "+00:00")
+    try:
+        parsed = datetime.fromisoformat(normalized)
+    except ValueError:
+        return None
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_release_date_text(text: str) -> str:
+    parsed = parse_iso_datetime(text)
+    if not parsed:
+        return ""
+    return sys.intern(parsed.date().isoformat())
+
+
+def normalize_release_date(value: Any) -> str:
+    if not value:
+        return ""
+    return _normalize_release_date_text(str(value))
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_method_text(text: str) -> str:
+    cleaned = text.strip().lower().translate(METHOD_SEPARATORS)
+    if not cleaned:
+        return ""
+    while "__" in cleaned:
+        cleaned = cleaned.replace("__", "_")
+    cleaned = cleaned.strip("_")
+    return sys.intern(INPUT_METHOD_ALIASES.get(cleaned, cleaned))
+
+
+def normalize_method_code(value: Any) -> str:
+    if not value:
+        return ""
+    return _normalize_method_text(str(value))
+
+
+def dedupe_keep_order(values: list[str]) -> list[str]:
+    seen: set[str] = set()
+    result: list[str] = []
+    for value in values:
+        if value in seen:
+            continue
+        seen.add(value)
+        result.append(value)
+    return result
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_method_tuple(values: tuple[str, ...]) -> tuple[str, ...]:
+    parsed = [normalize_method_code(item) for item in values]
+    return tuple(dedupe_keep_order([item for item in parsed if item]))
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _parse_method_text(text: str) -> tuple[str, ...]:
+    if "," in text:
+        parts = [item.strip() for item in text.split(",")]
+    elif "|" in text:
+        parts = [item.strip() for item in text.split("|")]
+    elif "/" in text:
+        parts = [item.strip() for item in text.split("/")]
+    elif " + " in text:
+        parts = [item.strip() for item in text.split("+")]
+    else:
+        parts = [text]
+    return _normalize_method_tuple(tuple(parts))
+
+
+def parse_input_methods(value: Any, *, fallback: list[str] | None = None) -> list[str]:
+    parsed: tuple[str, ...] = ()
+    if isinstance(value, list):
+        if all(isinstance(item, str) for item in value):
+            parsed = _normalize_method_tuple(tuple(value))
+        else:
+            # Non-string items (numbers, nested objects) bypass the cache.
+            parsed = _normalize_method_tuple.__wrapped__(tuple(value))
+    elif isinstance(value, str):
+        text = value.strip()
+        if text:
+            parsed = _parse_method_text(text)
+
+    if parsed:
+        return list(parsed)
+    return dedupe_keep_order(list(fallback or []))
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _input_methods_label_tuple(methods: tuple[str, ...]) -> str:
+    labels = [INPUT_METHOD_LABELS.get(method, method.replace("_", " ").title()) for method in methods]
+    return sys.intern(" + ".join(labels))
+
+
+def input_methods_label(methods: list[str]) -> str:
+    return _input_methods_label_tuple(tuple(methods))
+
+
+def normalize_cache_info() -> dict[str, Any]:
+    functions = {
+        "status": _normalize_status_text,
+        "release_date": _normalize_release_date_text,
+        "method_code": _normalize_method_text,
+        "method_list": _normalize_method_tuple,
+        "method_text": _parse_method_text,
+        "methods_label": _input_methods_label_tuple,
+    }
+    return {name: function.cache_info()._asdict() for name, function in functions.items()}
@@ -11,22 +11,64 @@ It only updates:
 from __future__ import annotations
 
 import argparse
+import base64
+import cProfile
+import functools
+import http.client
 import ipaddress
 import json
 import os
+import queue
+import signal
+import socketserver
+import threading
+import time
 import urllib.error
 import urllib.parse
-import urllib.request
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
 from hashlib import sha256
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator, TypeVar
+
+from landing_images import (
+    DEFAULT_BYTE_BUDGETS,
+    DERIVATIVE_ERRORS,
+    build_derivatives,
+    derivatives_available,
+    parse_byte_budgets,
+    srcset_by_type,
+    srcset_paths,
+)
+from landing_http import HttpClient
+from landing_normalize import (
+    dedupe_keep_order,
+    input_methods_label,
+    normalize_release_date,
+    normalize_status,
+    parse_input_methods,
+    parse_iso_datetime,
+)
 
 ROOT = Path(__file__).resolve().parents[2]
 CATALOG_PATH = ROOT / "landing-automation" / "config" / "app_catalog.json"
 OUTPUT_PATH = ROOT / "data" / "landing-apps.generated.json"
 STATE_PATH = ROOT / "landing-automation" / "state" / "landing_state.json"
+SCREENSHOT_VALIDATORS_PATH = ROOT / "landing-automation" / "state" / "screenshot_validators.json"
 ASSETS_DIR = ROOT / "assets" / "asc-screenshots"
+CONTENT_STORE_DIR = ASSETS_DIR / "by-hash"
+DERIVATIVES_DIR = ASSETS_DIR / "derived"
+CONTENT_HASH_CHARS = 32
+CACHE_DIR = ROOT / "landing-automation" / "cache"
+ASSET_HASH_INDEX_PATH = CACHE_DIR / "asset_hash_index.json"
+APP_STORE_LOOKUP_CACHE_DIR = CACHE_DIR / "app-store-lookup"
+COMPILED_CATALOG_PATH = CACHE_DIR / "compiled_catalog.json"
+JOURNAL_PATH = CACHE_DIR / "landing_journal.jsonl"
+JOURNAL_MAX_BYTES = 1024 * 1024
+# Bump when catalog_entry_defaults changes so stale compiled catalogs are rebuilt.
+COMPILED_CATALOG_VERSION = 1
 ALLOWED_SCREENSHOT_DOMAINS = tuple(
     domain.strip().lower()
     for domain in os.getenv(
@@ -36,35 +78,100 @@ ALLOWED_SCREENSHOT_DOMAINS = tuple(
     if domain.strip()
 )
 MAX_SCREENSHOT_BYTES = int(os.getenv("LANDING_MAX_SCREENSHOT_BYTES", str(10 * 1024 * 1024)))
+# WIDTH:MAX_BYTES per derivative; empty disables WebP/JPEG derivatives.
+IMAGE_DERIVATIVE_BUDGETS = parse_byte_budgets(os.getenv("LANDING_IMAGE_DERIVATIVE_BUDGETS", DEFAULT_BYTE_BUDGETS))
+CONTENT_STORE_GRACE_DAYS = int(os.getenv("LANDING_CONTENT_STORE_GRACE_DAYS", "30"))
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("LANDING_HTTP_MAX_CONNECTIONS_PER_HOST", "6"))
+HTTP_RETRIES = int(os.getenv("LANDING_HTTP_RETRIES", "3"))
+SCREENSHOT_DOWNLOAD_WORKERS = int(os.getenv("LANDING_SCREENSHOT_DOWNLOAD_WORKERS", "4"))
+PROCESSED_EVENT_CAPACITY = int(os.getenv("LANDING_PROCESSED_EVENT_CAPACITY", "2000"))
+PROCESSED_EVENT_MAX_AGE_DAYS = int(os.getenv("LANDING_PROCESSED_EVENT_MAX_AGE_DAYS", "365"))
+PROCESSED_EVENT_FINGERPRINT_BYTES = 8
 APP_STORE_LOOKUP_URL = "https://itunes.apple.com/lookup"
 APP_STORE_LOOKUP_TIMEOUT = int(os.getenv("LANDING_APP_STORE_LOOKUP_TIMEOUT", "30"))
+APP_STORE_LOOKUP_CHUNK_SIZE = int(os.getenv("LANDING_APP_STORE_LOOKUP_CHUNK_SIZE", "100"))
+APP_STORE_LOOKUP_WORKERS = int(os.getenv("LANDING_APP_STORE_LOOKUP_WORKERS", "4"))
+APP_STORE_LOOKUP_MAX_AGE = int(os.getenv("LANDING_APP_STORE_LOOKUP_MAX_AGE", "3600"))
+DAEMON_FLUSH_INTERVAL = float(os.getenv("LANDING_DAEMON_FLUSH_INTERVAL", "5"))
+DAEMON_IDLE_FLUSH = float(os.getenv("LANDING_DAEMON_IDLE_FLUSH", "0.5"))
+DAEMON_POLL_INTERVAL = float(os.getenv("LANDING_DAEMON_POLL_INTERVAL", "0.25"))
+COALESCE_WINDOW = float(os.getenv("LANDING_COALESCE_WINDOW", "0"))
+CHECKPOINT_EVERY = int(os.getenv("LANDING_CHECKPOINT_EVERY", "1"))
 
 VISIBLE_STATUSES = {"submitted", "released"}
 HEALTH_APP_CATEGORIES = {"health"}
-INPUT_METHOD_LABELS = {
-    "camera_ocr": "Camera + OCR",
-    "voice_input": "Voice Input",
-    "sound_detection": "Sound Detection",
-    "camera_ar": "Camera + AR",
-}
 CATEGORY_DEFAULT_INPUT_METHODS = {
     "camera": ["camera_ocr"],
     "voice": ["voice_input"],
     "sound": ["sound_detection"],
 }
-STATE_SUBMITTED = {
-    "WAITING_FOR_REVIEW",
-    "IN_REVIEW",
-    "PENDING_DEVELOPER_RELEASE",
-    "PENDING_APPLE_RELEASE",
-    "PENDING_CONTRACT",
-    "PROCESSING_FOR_DISTRIBUTION",
-    "PREORDER_READY_FOR_SALE",
-}
-STATE_RELEASED = {
-    "READY_FOR_DISTRIBUTION",
-    "READY_FOR_SALE",
-}
+F = TypeVar("F", bound=Callable[..., Any])
+# One keep-alive pool for the Lookup endpoint and the screenshot hosts.
+HTTP_CLIENT = HttpClient(max_per_host=HTTP_MAX_CONNECTIONS_PER_HOST, retries=HTTP_RETRIES)
+
+
+class StageTimings:
+    """Wall time, call count and transferred bytes per updater stage.
+
+    Stages running on worker threads accumulate per-call time, so their totals
+    can exceed the wall time of the enclosing stage.
+    """
+
+    def __init__(self) -> None:
+        self.stages: dict[str, dict[str, float]] = {}
+        self.lock = threading.Lock()
+
+    def record(self, name: str, seconds: float = 0.0, *, calls: int = 1, transferred: int = 0) -> None:
+        with self.lock:
+            stats = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0, "bytes": 0})
+            stats["seconds"] += seconds
+            stats["calls"] += calls
+            stats["bytes"] += transferred
+
+    def add_bytes(self, name: str, transferred: int) -> None:
+        self.record(name, calls=0, transferred=transferred)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def timed(self, name: str) -> Callable[[F], F]:
+        def decorator(function: F) -> F:
+            @functools.wraps(function)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.stage(name):
+                    return function(*args, **kwargs)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        with self.lock:
+            return {
+                name: {
+                    "seconds": round(stats["seconds"], 6),
+                    "calls": int(stats["calls"]),
+                    "bytes": int(stats["bytes"]),
+                }
+                for name, stats in self.stages.items()
+            }
+
+    def summary(self) -> str:
+        parts = []
+        for name, stats in self.to_dict().items():
+            part = f"{name}:{stats['seconds']:.3f}s/{stats['calls']}"
+            if stats["bytes"]:
+                part += f"/{stats['bytes']}B"
+            parts.append(part)
+        return ",".join(parts)
+
+
+TIMINGS = StageTimings()
 
 
 def load_json(path: Path, default_value: Any) -> Any:
@@ -74,18 +181,147 @@ def load_json(path: Path, default_value: Any) -> Any:
         return json.load(file)
 
 
+def write_synced(path: Path, content: bytes) -> None:
+    with path.open("wb") as file:
+        file.write(content)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def fsync_directory(path: Path) -> None:
+    # Makes a completed rename durable; directories cannot be opened for fsync on Windows.
+    if os.name != "posix":
+        return
+    descriptor = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        write_synced(temp_file, content)
+        os.replace(temp_file, path)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+    fsync_directory(path.parent)
+
+
+def save_bytes_if_changed(path: Path, content: bytes) -> bool:
+    if path.exists() and path.read_bytes() == content:
+        return False
+    atomic_write_bytes(path, content)
+    return True
+
+
+def stage_json_if_changed(path: Path, payload: Any) -> bytes | None:
+    """Return the encoded payload when ``path`` needs rewriting, else None.
+
+    The file on disk is always compared: a digest recorded in state says
+    nothing about a file that was edited, reverted or restored since.
+    """
+    new_content = (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    if path.exists() and path.read_bytes() == new_content:
+        return None
+    return new_content
+
+
 def save_json_if_changed(path: Path, payload: Any) -> bool:
-    new_content = json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
-    old_content = ""
-    if path.exists():
-        old_content = path.read_text(encoding="utf-8")
-    if old_content == new_content:
+    content = stage_json_if_changed(path, payload)
+    if content is None:
         return False
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(new_content, encoding="utf-8")
+    atomic_write_bytes(path, content)
     return True
 
 
+def pending_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.pending")
+
+
+def append_journal(journal_path: Path, record: dict[str, Any]) -> None:
+    journal_path.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":")) + "\n"
+    with journal_path.open("a", encoding="utf-8") as file:
+        file.write(line)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def commit_journaled(journal_path: Path | None, writes: list[tuple[Path, bytes]]) -> None:
+    """Replace several files as one unit that recover_journal can roll forward.
+
+    Every new version is first written and fsynced next to its target as a
+    ``.pending`` file, then a ``begin`` record with their hashes is appended
+    to the journal. Only then are the pending files renamed into place,
+    followed by a ``commit`` record.
+    """
+    if not writes:
+        return
+    if journal_path is None:
+        for path, content in writes:
+            atomic_write_bytes(path, content)
+        return
+
+    for path, content in writes:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_synced(pending_path(path), content)
+    sequence = time.time_ns()
+    append_journal(
+        journal_path,
+        {
+            "seq": sequence,
+            "phase": "begin",
+            "at": now_iso(),
+            "files": {str(path.resolve()): sha256(content).hexdigest() for path, content in writes},
+        },
+    )
+    for path, _content in writes:
+        os.replace(pending_path(path), path)
+        fsync_directory(path.parent)
+    append_journal(journal_path, {"seq": sequence, "phase": "commit"})
+
+    if journal_path.stat().st_size > JOURNAL_MAX_BYTES:
+        os.replace(journal_path, journal_path.with_name(journal_path.name + ".1"))
+
+
+def recover_journal(journal_path: Path | None) -> None:
+    """Finish a journaled write interrupted between its ``begin`` and ``commit`` records."""
+    if journal_path is None or not journal_path.exists():
+        return
+    last_record: dict[str, Any] | None = None
+    with journal_path.open("r", encoding="utf-8") as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn final line from a crash mid-append
+            if isinstance(record, dict):
+                last_record = record
+    if not last_record or last_record.get("phase") != "begin":
+        return
+
+    rolled_forward = 0
+    for name, expected_hash in (last_record.get("files") or {}).items():
+        path = Path(name)
+        pending = pending_path(path)
+        if path.exists() and file_hash(path) == expected_hash:
+            pending.unlink(missing_ok=True)
+            continue
+        if pending.exists() and file_hash(pending) == expected_hash:
+            os.replace(pending, path)
+            fsync_directory(path.parent)
+            rolled_forward += 1
+            continue
+        raise RuntimeError(f"journal recovery failed: no intact copy of {path} (expected sha256 {expected_hash})")
+
+    append_journal(journal_path, {"seq": last_record.get("seq"), "phase": "commit", "recovered": True})
+    print(f"[WARN] recovered interrupted write from {journal_path.name}: rolled forward {rolled_forward} file(s)")
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Update landing app JSON")
     parser.add_argument(
@@ -94,12 +330,30 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Path to webhook event payload JSON",
     )
+    parser.add_argument(
+        "--event-dir",
+        type=Path,
+        default=None,
+        help="Directory of webhook event payload JSON files applied in filename order",
+    )
+    parser.add_argument(
+        "--events-jsonl",
+        type=Path,
+        default=None,
+        help="Path to JSON Lines file with one webhook event payload per line",
+    )
     parser.add_argument(
         "--catalog",
         type=Path,
         default=CATALOG_PATH,
         help="Path to app catalog JSON",
     )
+    parser.add_argument(
+        "--compiled-catalog",
+        type=Path,
+        default=COMPILED_CATALOG_PATH,
+        help="Path to compiled catalog cache (indexes + per-slug defaults), rebuilt when the catalog hash changes",
+    )
     parser.add_argument(
         "--output",
         type=Path,
@@ -112,6 +366,57 @@ def parse_args() -> argparse.Namespace:
         default=STATE_PATH,
         help="Path to state cache JSON",
     )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        default=JOURNAL_PATH,
+        help="Append-only journal that makes the output + state write crash-safe and recoverable on restart",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=CHECKPOINT_EVERY,
+        help=(
+            "Batch mode: save output and state after every N applied updates (after coalescing) "
+            "so a rerun after a crash skips everything already applied; 0 saves once at the end"
+        ),
+    )
+    parser.add_argument(
+        "--shard-dir",
+        type=Path,
+        default=None,
+        help="Also write a manifest plus one JSON file per app into this directory",
+    )
+    parser.add_argument(
+        "--publish-dir",
+        type=Path,
+        default=None,
+        help="Also write minified, fingerprinted output plus a pointer file into this directory",
+    )
+    parser.add_argument(
+        "--timings-json",
+        type=Path,
+        default=None,
+        help="Write per-stage wall time, call counts and bytes transferred to this JSON file",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        help="Write a cProfile dump of the main thread to this file (implies a timings summary)",
+    )
+    parser.add_argument(
+        "--screenshot-validators",
+        type=Path,
+        default=SCREENSHOT_VALIDATORS_PATH,
+        help="Path to ETag/Last-Modified cache JSON for conditional screenshot requests",
+    )
+    parser.add_argument(
+        "--asset-hash-index",
+        type=Path,
+        default=ASSET_HASH_INDEX_PATH,
+        help="Path to local SHA-256 index of downloaded screenshots (keyed by path, size and mtime)",
+    )
     parser.add_argument(
         "--bootstrap",
         action="store_true",
@@ -125,7 +430,72 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--lookup-country",
         default=os.getenv("LANDING_APP_STORE_LOOKUP_COUNTRY", "jp"),
-        help="App Store Lookup country code for public metadata reconciliation",
+        help="Comma-separated App Store Lookup country codes; the first public storefront wins per app",
+    )
+    parser.add_argument(
+        "--lookup-chunk-size",
+        type=int,
+        default=APP_STORE_LOOKUP_CHUNK_SIZE,
+        help="Maximum number of app ids per App Store Lookup request",
+    )
+    parser.add_argument(
+        "--lookup-workers",
+        type=int,
+        default=APP_STORE_LOOKUP_WORKERS,
+        help="Maximum number of concurrent App Store Lookup requests",
+    )
+    parser.add_argument(
+        "--lookup-cache-dir",
+        type=Path,
+        default=APP_STORE_LOOKUP_CACHE_DIR,
+        help="Directory for cached App Store Lookup responses",
+    )
+    parser.add_argument(
+        "--max-lookup-age",
+        type=int,
+        default=APP_STORE_LOOKUP_MAX_AGE,
+        help="Reuse cached App Store Lookup responses younger than this many seconds (0 forces a fresh fetch, -1 replays the cache offline)",
+    )
+    parser.add_argument(
+        "--coalesce-window",
+        type=float,
+        default=COALESCE_WINDOW,
+        help="Collapse events for the same app arriving within this many seconds into one update (0 disables)",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep catalog, state and output in memory and apply events from --spool-dir and/or --daemon-socket until SIGTERM",
+    )
+    parser.add_argument(
+        "--spool-dir",
+        type=Path,
+        default=Path(os.environ["LANDING_SPOOL_DIR"]) if os.getenv("LANDING_SPOOL_DIR") else None,
+        help="Daemon: directory polled for *.json event files (write to a temp name, then rename)",
+    )
+    parser.add_argument(
+        "--daemon-socket",
+        type=Path,
+        default=Path(os.environ["LANDING_DAEMON_SOCKET"]) if os.getenv("LANDING_DAEMON_SOCKET") else None,
+        help="Daemon: Unix socket accepting one JSON event per line",
+    )
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        default=DAEMON_FLUSH_INTERVAL,
+        help="Daemon: flush to disk at most this many seconds after the first unflushed event",
+    )
+    parser.add_argument(
+        "--idle-flush",
+        type=float,
+        default=DAEMON_IDLE_FLUSH,
+        help="Daemon: flush to disk once no new event has arrived for this many seconds",
+    )
+    parser.add_argument(
+        "--screenshot-workers",
+        type=int,
+        default=SCREENSHOT_DOWNLOAD_WORKERS,
+        help="Maximum number of concurrent screenshot downloads per event",
     )
     return parser.parse_args()
 
@@ -134,19 +504,8 @@ def now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
-def normalize_status(raw_status: str | None) -> str:
-    if not raw_status:
-        return "unknown"
-    upper = raw_status.upper()
-    if upper in STATE_RELEASED:
-        return "released"
-    if upper in STATE_SUBMITTED:
-        return "submitted"
-    if "REJECT" in upper:
-        return "rejected"
-    if "PREPARE" in upper or "DEVELOPER" in upper:
-        return "draft"
-    return "unknown"
+def utc_today() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
 
 
 def as_bool(value: Any, *, default: bool = False) -> bool:
@@ -172,112 +531,6 @@ def default_card_image_path(catalog_app: dict[str, Any]) -> str:
     return str(catalog_app.get("card_image_path") or catalog_app.get("fallback_image_path") or "")
 
 
-def parse_iso_datetime(value: Any) -> datetime | None:
-    if not value:
-        return None
-    text = str(value).strip()
-    if not text:
-        return None
-
-    if len(text) == 10 and text[4] == "-" and text[7] == "-":
-        try:
-            return datetime.strptime(text, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        except ValueError:
-            return None
-
-    normalized = text.replace("Z", "+00:00")
-    try:
-        parsed = datetime.fromisoformat(normalized)
-    except ValueError:
-        return None
-
-    if parsed.tzinfo is None:
-        return parsed.replace(tzinfo=timezone.utc)
-    return parsed.astimezone(timezone.utc)
-
-
-def normalize_release_date(value: Any) -> str:
-    parsed = parse_iso_datetime(value)
-    if not parsed:
-        return ""
-    return parsed.date().isoformat()
-
-
-def normalize_method_code(value: Any) -> str:
-    if not value:
-        return ""
-    text = str(value).strip().lower()
-    if not text:
-        return ""
-
-    cleaned = (
-        text.replace("&", "_")
-        .replace("/", "_")
-        .replace("-", "_")
-        .replace(" ", "_")
-        .replace("+", "_")
-    )
-    while "__" in cleaned:
-        cleaned = cleaned.replace("__", "_")
-    cleaned = cleaned.strip("_")
-
-    aliases = {
-        "camera": "camera_ocr",
-        "ocr": "camera_ocr",
-        "camera_ocr": "camera_ocr",
-        "voice": "voice_input",
-        "speech": "voice_input",
-        "voice_input": "voice_input",
-        "sound": "sound_detection",
-        "audio": "sound_detection",
-        "sound_detection": "sound_detection",
-        "camera_ar": "camera_ar",
-        "ar_camera": "camera_ar",
-    }
-    return aliases.get(cleaned, cleaned)
-
-
-def dedupe_keep_order(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    result: list[str] = []
-    for value in values:
-        if value in seen:
-            continue
-        seen.add(value)
-        result.append(value)
-    return result
-
-
-def parse_input_methods(value: Any, *, fallback: list[str] | None = None) -> list[str]:
-    fallback_methods = list(fallback or [])
-
-    if isinstance(value, list):
-        parsed = [normalize_method_code(item) for item in value]
-        filtered = [item for item in parsed if item]
-        return dedupe_keep_order(filtered) or dedupe_keep_order(fallback_methods)
-
-    if isinstance(value, str):
-        text = value.strip()
-        if text:
-            parts: list[str]
-            if "," in text:
-                parts = [item.strip() for item in text.split(",")]
-            elif "|" in text:
-                parts = [item.strip() for item in text.split("|")]
-            elif "/" in text:
-                parts = [item.strip() for item in text.split("/")]
-            elif " + " in text:
-                parts = [item.strip() for item in text.split("+")]
-            else:
-                parts = [text]
-
-            parsed = [normalize_method_code(item) for item in parts]
-            filtered = [item for item in parsed if item]
-            return dedupe_keep_order(filtered) or dedupe_keep_order(fallback_methods)
-
-    return dedupe_keep_order(fallback_methods)
-
-
 def default_input_methods(catalog_app: dict[str, Any]) -> list[str]:
     explicit = parse_input_methods(catalog_app.get("input_methods"), fallback=[])
     if explicit:
@@ -285,11 +538,6 @@ def default_input_methods(catalog_app: dict[str, Any]) -> list[str]:
     return list(CATEGORY_DEFAULT_INPUT_METHODS.get(str(catalog_app.get("category") or ""), []))
 
 
-def input_methods_label(methods: list[str]) -> str:
-    labels = [INPUT_METHOD_LABELS.get(method, method.replace("_", " ").title()) for method in methods]
-    return " + ".join(labels)
-
-
 def pick_release_date_from_context(payload: dict[str, Any], event_data: dict[str, Any]) -> str:
     client_payload = event_data.get("client_payload", event_data)
     candidates = [
@@ -376,17 +624,200 @@ def safe_slug(slug: str) -> str:
     return normalized
 
 
-def download_screenshot(url: str, slug: str) -> tuple[str, bool]:
+@dataclass
+class ScreenshotCache:
+    validators: dict[str, Any]
+    asset_hashes: dict[str, Any]
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def load_screenshot_cache(validators_path: Path, asset_index_path: Path) -> ScreenshotCache:
+    validators = load_json(validators_path, {})
+    if not isinstance(validators, dict):
+        validators = {}
+    urls = validators.get("urls")
+    asset_index = load_json(asset_index_path, {})
+    files = asset_index.get("files") if isinstance(asset_index, dict) else None
+    return ScreenshotCache(
+        validators={
+            "schema_version": 1,
+            "urls": {key: value for key, value in (urls or {}).items() if isinstance(value, dict)},
+            "unreferenced_since": dict(validators.get("unreferenced_since") or {}),
+        },
+        asset_hashes={
+            "schema_version": 1,
+            "files": {key: value for key, value in (files or {}).items() if isinstance(value, dict)},
+        },
+    )
+
+
+def asset_index_key(path: Path) -> str:
+    return path.relative_to(ROOT).as_posix()
+
+
+def record_asset_hash(cache: ScreenshotCache | None, path: Path, content_hash: str) -> None:
+    if cache is None:
+        return
+    stat = path.stat()
+    with cache.lock:
+        cache.asset_hashes["files"][asset_index_key(path)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": content_hash,
+        }
+
+
+def asset_file_hash(cache: ScreenshotCache | None, path: Path) -> str:
+    if cache is None:
+        return file_hash(path)
+    stat = path.stat()
+    with cache.lock:
+        indexed = cache.asset_hashes["files"].get(asset_index_key(path))
+    if indexed and indexed.get("size") == stat.st_size and indexed.get("mtime_ns") == stat.st_mtime_ns:
+        return str(indexed["sha256"])
+    content_hash = file_hash(path)
+    record_asset_hash(cache, path, content_hash)
+    return content_hash
+
+
+def content_store_path(content_hash: str, extension: str) -> Path:
+    return CONTENT_STORE_DIR / f"{content_hash[:CONTENT_HASH_CHARS]}{extension}"
+
+
+def prune_content_store(cache: ScreenshotCache, output: dict[str, Any]) -> None:
+    """Delete hashed screenshots and derivatives unreferenced for the grace period.
+
+    Their URLs are immutable, so an older deploy or a CDN copy of the landing
+    JSON may still point at them; the first day a file was seen unreferenced
+    is kept in the validators state so the grace period survives fresh checkouts.
+    """
+    referenced: set[str] = set()
+    for entry in output.get("apps", []):
+        if not isinstance(entry, dict):
+            continue
+        referenced.add(str(entry.get("promo_image_path") or ""))
+        referenced.update(srcset_paths(entry.get("promo_image_srcset") or {}))
+        referenced.update(srcset_paths(entry.get("card_image_srcset") or {}))
+    with cache.lock:
+        referenced.update(str(record.get("path") or "") for record in cache.validators["urls"].values())
+
+    unreferenced = cache.validators["unreferenced_since"]
+    today = utc_today()
+    present: set[str] = set()
+    for path in [*CONTENT_STORE_DIR.glob("*"), *DERIVATIVES_DIR.glob("*")]:
+        if not path.is_file() or path.name.startswith("."):
+            continue
+        relative_path = path.relative_to(ROOT).as_posix()
+        if relative_path in referenced:
+            unreferenced.pop(relative_path, None)
+            continue
+        since = unreferenced.setdefault(relative_path, today)
+        if (date.fromisoformat(today) - date.fromisoformat(since)).days >= CONTENT_STORE_GRACE_DAYS:
+            path.unlink(missing_ok=True)
+            unreferenced.pop(relative_path, None)
+            print(f"[INFO] pruned unreferenced screenshot asset: {relative_path}")
+        else:
+            present.add(relative_path)
+    for relative_path in [key for key in unreferenced if key not in present]:
+        unreferenced.pop(relative_path, None)
+
+
+def prune_asset_hashes(cache: ScreenshotCache) -> None:
+    files = cache.asset_hashes["files"]
+    for key in [key for key in files if not (ROOT / key).is_file()]:
+        files.pop(key, None)
+
+
+def cached_screenshot_validator(
+    cache: ScreenshotCache | None,
+    url: str,
+) -> dict[str, Any] | None:
+    # Validators are keyed by URL only: apps that share a screenshot URL share its record.
+    if cache is None:
+        return None
+    with cache.lock:
+        cached = cache.validators["urls"].get(url)
+    if not cached or not cached.get("path"):
+        return None
+    if not (ROOT / cached["path"]).is_file():
+        return None
+    if not cached.get("etag") and not cached.get("last_modified"):
+        return None
+    return cached
+
+
+def validator_slugs(record: dict[str, Any]) -> list[str]:
+    slugs = record.get("slugs")
+    if isinstance(slugs, list):
+        return [str(slug) for slug in slugs]
+    # Records written before validators were shared carry a single slug.
+    return [str(record["slug"])] if record.get("slug") else []
+
+
+def remember_screenshot_validator(
+    cache: ScreenshotCache | None,
+    url: str,
+    slug: str,
+    relative_path: str,
+    headers: Any,
+    content_hash: str,
+) -> None:
+    if cache is None:
+        return
+    record: dict[str, Any] = {
+        "path": relative_path,
+        "sha256": content_hash,
+    }
+    etag = headers.get("ETag")
+    if etag:
+        record["etag"] = etag
+    last_modified = headers.get("Last-Modified")
+    if last_modified:
+        record["last_modified"] = last_modified
+
+    with cache.lock:
+        urls = cache.validators["urls"]
+        # Keep one validator per slug: a new first screenshot URL replaces the old one,
+        # and a URL is dropped once no slug points at it any more.
+        for other_url, other in list(urls.items()):
+            if other_url == url or slug not in validator_slugs(other):
+                continue
+            remaining = [other_slug for other_slug in validator_slugs(other) if other_slug != slug]
+            if remaining:
+                other.pop("slug", None)
+                other["slugs"] = remaining
+            else:
+                urls.pop(other_url, None)
+        existing = urls.get(url)
+        slugs = validator_slugs(existing) if existing else []
+        record["slugs"] = sorted({*slugs, slug})
+        urls[url] = record
+
+
+@TIMINGS.timed("screenshot_download")
+def download_screenshot(
+    url: str,
+    slug: str,
+    cache: ScreenshotCache | None = None,
+) -> tuple[str, bool]:
     ASSETS_DIR.mkdir(parents=True, exist_ok=True)
     secure_url = validate_screenshot_url(url)
     safe_name = safe_slug(slug)
     extension = guess_extension(secure_url)
-    target = ASSETS_DIR / f"{safe_name}{extension}"
     temp_file = ASSETS_DIR / f".{safe_name}.tmp{extension}"
 
-    request = urllib.request.Request(secure_url, headers={"User-Agent": "allnew-landing-sync/1.0"})
+    headers: dict[str, str] = {}
+    cached = cached_screenshot_validator(cache, secure_url)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    digest = sha256()
     try:
-        with urllib.request.urlopen(request, timeout=30) as response:  # nosec: URL is validated by allowlist before access
+        # Redirect targets are re-checked against the allowlist before they are fetched.
+        with HTTP_CLIENT.open(secure_url, headers=headers, timeout=30, validate_url=validate_screenshot_url) as response:
             content_type = response.headers.get("Content-Type", "")
             if not content_type.lower().startswith("image/"):
                 raise RuntimeError("screenshot response is not image content")
@@ -394,9 +825,9 @@ def download_screenshot(url: str, slug: str) -> tuple[str, bool]:
             final_extension = guess_extension(secure_url, content_type)
             if final_extension != extension:
                 extension = final_extension
-                target = ASSETS_DIR / f"{safe_name}{extension}"
                 temp_file = ASSETS_DIR / f".{safe_name}.tmp{extension}"
 
+            response_headers = response.headers
             total = 0
             with temp_file.open("wb") as file:
                 while True:
@@ -406,21 +837,144 @@ def download_screenshot(url: str, slug: str) -> tuple[str, bool]:
                     total += len(chunk)
                     if total > MAX_SCREENSHOT_BYTES:
                         raise RuntimeError("screenshot exceeds max allowed size")
+                    digest.update(chunk)
                     file.write(chunk)
+    except urllib.error.HTTPError as error:
+        temp_file.unlink(missing_ok=True)
+        if cached and error.code == 304:
+            # Re-register so this slug joins the shared record and releases its previous URL.
+            response_headers = {
+                "ETag": error.headers.get("ETag") or cached.get("etag"),
+                "Last-Modified": error.headers.get("Last-Modified") or cached.get("last_modified"),
+            }
+            remember_screenshot_validator(
+                cache,
+                secure_url,
+                slug,
+                cached["path"],
+                response_headers,
+                str(cached.get("sha256") or ""),
+            )
+            return cached["path"], False
+        raise
     except Exception:
         temp_file.unlink(missing_ok=True)
         raise
 
-    changed = True
-    if target.exists() and file_hash(target) == file_hash(temp_file):
-        changed = False
+    TIMINGS.add_bytes("screenshot_download", total)
+    content_hash = digest.hexdigest()
+    # Files are named by content, so identical bytes (any app or version) are stored once.
+    target = content_store_path(content_hash, extension)
+    changed = not target.exists()
 
     if changed:
+        target.parent.mkdir(parents=True, exist_ok=True)
         temp_file.replace(target)
     else:
         temp_file.unlink(missing_ok=True)
+    # The bytes were just hashed, so an existing file is indexed without re-reading it.
+    record_asset_hash(cache, target, content_hash)
+
+    relative_path = target.relative_to(ROOT).as_posix()
+    remember_screenshot_validator(cache, secure_url, slug, relative_path, response_headers, content_hash)
+    return relative_path, changed
+
 
-    return target.relative_to(ROOT).as_posix(), changed
+@TIMINGS.timed("image_derivatives")
+def screenshot_srcset(relative_path: str, slug: str, cache: ScreenshotCache | None = None) -> dict[str, str]:
+    if not derivatives_available() or not IMAGE_DERIVATIVE_BUDGETS:
+        return {}
+    source = ROOT / relative_path
+    try:
+        derivatives = build_derivatives(
+            source,
+            DERIVATIVES_DIR,
+            asset_file_hash(cache, source)[:CONTENT_HASH_CHARS],
+            IMAGE_DERIVATIVE_BUDGETS,
+        )
+    except DERIVATIVE_ERRORS as error:  # PIL.UnidentifiedImageError is an OSError
+        print(f"[WARN] image derivatives failed for {slug}: {error}")
+        return {}
+    return srcset_by_type(derivatives, ROOT)
+
+
+@functools.lru_cache(maxsize=256)
+def _card_image_srcset(relative_path: str, size: int, mtime_ns: int) -> tuple[tuple[str, str], ...]:
+    return tuple(screenshot_srcset(relative_path, relative_path).items())
+
+
+def card_image_srcset(card_image_path: str) -> dict[str, str]:
+    """Derivatives for a repository-local card image, memoized per file version."""
+    if not card_image_path or "://" in card_image_path:
+        return {}
+    # Cache-busting queries (``?v=2``) are not part of the file name.
+    relative_path = card_image_path.split("?", 1)[0].split("#", 1)[0].removeprefix("./")
+    try:
+        stat = (ROOT / relative_path).stat()
+    except OSError:
+        return {}
+    return dict(_card_image_srcset(relative_path, stat.st_size, stat.st_mtime_ns))
+
+
+def set_card_image_srcset(entry: dict[str, Any]) -> dict[str, Any]:
+    srcset = card_image_srcset(str(entry.get("card_image_path") or ""))
+    if srcset:
+        entry["card_image_srcset"] = srcset
+    else:
+        entry.pop("card_image_srcset", None)
+    return entry
+
+
+# (promo_image_path, changed, promo_image_srcset by MIME type) or the download error.
+ScreenshotResult = tuple[str, bool, dict[str, str]] | Exception
+
+
+def payload_screenshot_url(payload: dict[str, Any]) -> str:
+    return str(payload.get("first_screenshot_url") or payload.get("promo_image_url") or "")
+
+
+def download_slug_screenshots(
+    slug: str,
+    urls: list[str],
+    cache: ScreenshotCache | None = None,
+) -> dict[tuple[str, str], ScreenshotResult]:
+    # One slug's URLs run sequentially in payload order so its validator and temp file stay single-writer.
+    results: dict[tuple[str, str], ScreenshotResult] = {}
+    for url in urls:
+        try:
+            relative_path, changed = download_screenshot(url, slug, cache)
+            results[(slug, url)] = (relative_path, changed, screenshot_srcset(relative_path, slug, cache))
+        except (urllib.error.URLError, ValueError, RuntimeError) as error:
+            results[(slug, url)] = error
+    return results
+
+
+def prefetch_screenshots(
+    jobs: list[tuple[str, str]],
+    workers: int,
+    cache: ScreenshotCache | None = None,
+) -> dict[tuple[str, str], ScreenshotResult]:
+    urls_by_slug: dict[str, list[str]] = {}
+    for slug, url in jobs:
+        urls_by_slug.setdefault(slug, []).append(url)
+    if not urls_by_slug:
+        return {}
+
+    results: dict[tuple[str, str], ScreenshotResult] = {}
+    max_workers = max(1, min(workers, len(urls_by_slug)))
+    if max_workers == 1:
+        for slug, urls in urls_by_slug.items():
+            results.update(download_slug_screenshots(slug, urls, cache))
+        return results
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshot") as executor:
+        futures = [
+            executor.submit(download_slug_screenshots, slug, urls, cache)
+            for slug, urls in urls_by_slug.items()
+        ]
+        for future in futures:
+            results.update(future.result())
+    return results
 
 
 def event_identity_key(event_data: dict[str, Any]) -> str:
@@ -442,6 +996,84 @@ def event_identity_key(event_data: dict[str, Any]) -> str:
     return f"hash:{digest}"
 
 
+def event_fingerprint(event_key: str) -> bytes:
+    return sha256(event_key.encode("utf-8")).digest()[:PROCESSED_EVENT_FINGERPRINT_BYTES]
+
+
+@dataclass
+class ProcessedEventIndex:
+    """Processed event keys as 64-bit fingerprints bucketed by UTC day.
+
+    Persisted as one base64 blob per day under `processed_events` in the state file.
+    """
+
+    days: dict[str, list[bytes]] = field(default_factory=dict)
+    seen: set[bytes] = field(default_factory=set)
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> ProcessedEventIndex:
+        index = cls()
+        size = PROCESSED_EVENT_FINGERPRINT_BYTES
+        stored = state.get("processed_events")
+        if isinstance(stored, dict) and stored.get("fingerprint_bytes") == size:
+            for day, blob in sorted((stored.get("days") or {}).items()):
+                raw = base64.b64decode(str(blob))
+                for offset in range(0, len(raw) - size + 1, size):
+                    index.add_fingerprint(raw[offset:offset + size], day)
+
+        # Migrate the legacy `processed_event_ids` list into the bucket of its last update.
+        legacy_ids = state.get("processed_event_ids")
+        if isinstance(legacy_ids, list) and legacy_ids:
+            legacy_day = normalize_release_date(state.get("updated_at")) or utc_today()
+            for event_key in legacy_ids:
+                index.add(str(event_key), legacy_day)
+        return index
+
+    def __contains__(self, event_key: object) -> bool:
+        return isinstance(event_key, str) and event_fingerprint(event_key) in self.seen
+
+    def __len__(self) -> int:
+        return len(self.seen)
+
+    def add_fingerprint(self, fingerprint: bytes, day: str) -> None:
+        if fingerprint in self.seen:
+            return
+        self.seen.add(fingerprint)
+        self.days.setdefault(day, []).append(fingerprint)
+
+    def add(self, event_key: str, day: str | None = None) -> None:
+        self.add_fingerprint(event_fingerprint(event_key), day or utc_today())
+
+    def trim(self, *, capacity: int, max_age_days: int) -> None:
+        cutoff = (datetime.now(timezone.utc).date() - timedelta(days=max_age_days)).isoformat()
+        for day in sorted(self.days):
+            if day >= cutoff and len(self.seen) <= capacity:
+                break
+            fingerprints = self.days[day]
+            drop = len(fingerprints) if day < cutoff else min(len(fingerprints), len(self.seen) - capacity)
+            for fingerprint in fingerprints[:drop]:
+                self.seen.discard(fingerprint)
+            if drop == len(fingerprints):
+                del self.days[day]
+            else:
+                self.days[day] = fingerprints[drop:]
+
+    def to_state(
+        self,
+        *,
+        capacity: int = PROCESSED_EVENT_CAPACITY,
+        max_age_days: int = PROCESSED_EVENT_MAX_AGE_DAYS,
+    ) -> dict[str, Any]:
+        self.trim(capacity=capacity, max_age_days=max_age_days)
+        return {
+            "fingerprint_bytes": PROCESSED_EVENT_FINGERPRINT_BYTES,
+            "days": {
+                day: base64.b64encode(b"".join(self.days[day])).decode("ascii")
+                for day in sorted(self.days)
+            },
+        }
+
+
 def build_catalog_maps(catalog: dict[str, Any]) -> tuple[dict[str, dict[str, Any]], dict[str, str], dict[str, str]]:
     by_slug: dict[str, dict[str, Any]] = {}
     by_bundle: dict[str, str] = {}
@@ -460,58 +1092,148 @@ def build_catalog_maps(catalog: dict[str, Any]) -> tuple[dict[str, dict[str, Any
     return by_slug, by_bundle, by_app_id
 
 
-def default_output_entry(app: dict[str, Any]) -> dict[str, Any]:
+@dataclass
+class CompiledCatalog:
+    """Catalog plus its slug/bundle/app-id indexes and precomputed per-slug defaults."""
+
+    catalog_hash: str
+    catalog: dict[str, Any]
+    by_slug: dict[str, dict[str, Any]]
+    by_bundle: dict[str, str]
+    by_app_id: dict[str, str]
+    defaults: dict[str, dict[str, Any]]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema_version": COMPILED_CATALOG_VERSION,
+            "catalog_hash": self.catalog_hash,
+            "catalog": self.catalog,
+            "by_bundle": self.by_bundle,
+            "by_app_id": self.by_app_id,
+            "defaults": self.defaults,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> CompiledCatalog:
+        catalog = payload["catalog"]
+        return cls(
+            catalog_hash=payload["catalog_hash"],
+            catalog=catalog,
+            by_slug={app["slug"]: app for app in catalog.get("apps", [])},
+            by_bundle=payload["by_bundle"],
+            by_app_id=payload["by_app_id"],
+            defaults=payload["defaults"],
+        )
+
+
+def compile_catalog(catalog: dict[str, Any], catalog_hash: str | None = None) -> CompiledCatalog:
+    by_slug, by_bundle, by_app_id = build_catalog_maps(catalog)
+    return CompiledCatalog(
+        catalog_hash=catalog_hash or canonical_digest(catalog),
+        catalog=catalog,
+        by_slug=by_slug,
+        by_bundle=by_bundle,
+        by_app_id=by_app_id,
+        defaults={slug: catalog_entry_defaults(app) for slug, app in by_slug.items()},
+    )
+
+
+def load_compiled_catalog(catalog_path: Path, cache_path: Path | None) -> CompiledCatalog:
+    if not catalog_path.exists():
+        return compile_catalog({"apps": []})
+    raw = catalog_path.read_bytes()
+    catalog_hash = sha256(raw).hexdigest()
+
+    if cache_path is not None:
+        try:
+            cached = load_json(cache_path, {})
+        except (OSError, json.JSONDecodeError):
+            cached = {}
+        if (
+            isinstance(cached, dict)
+            and cached.get("schema_version") == COMPILED_CATALOG_VERSION
+            and cached.get("catalog_hash") == catalog_hash
+        ):
+            return CompiledCatalog.from_dict(cached)
+
+    compiled = compile_catalog(json.loads(raw.decode("utf-8")), catalog_hash)
+    if cache_path is not None:
+        save_json_if_changed(cache_path, compiled.to_dict())
+    return compiled
+
+
+def catalog_entry_defaults(app: dict[str, Any]) -> dict[str, Any]:
     methods = default_input_methods(app)
     return {
-        "slug": app["slug"],
-        "name": app.get("name", ""),
-        "name_ja": app.get("name_ja", ""),
-        "status": "released" if app.get("bootstrap_visible") else "draft",
-        "category": app.get("category", "camera"),
-        "category_label": app.get("category_label", ""),
-        "description_ja": app.get("description_ja", ""),
-        "description_en": app.get("description_en", ""),
-        "icon_path": app.get("icon_path", ""),
-        "promo_image_path": app.get("fallback_image_path", ""),
-        "card_image_path": default_card_image_path(app),
-        "promo_image_source": "catalog",
-        "input_methods": methods,
-        "input_methods_label": input_methods_label(methods),
-        "support_path": app.get("support_path", ""),
-        "app_store_url": app.get("app_store_url", ""),
-        "bundle_id": app.get("bundle_id", ""),
-        "asc_app_id": app.get("asc_app_id", ""),
-        "is_health_app": default_is_health_app(app),
-        "release_date": normalize_release_date(app.get("release_date")),
-        "featured_priority": int(app.get("featured_priority", 999)),
-        "sort_order": int(app.get("sort_order", 999)),
-        "published_to_landing": bool(app.get("bootstrap_visible", False)),
-        "updated_at": now_iso(),
+        "entry": {
+            "slug": app["slug"],
+            "name": app.get("name", ""),
+            "name_ja": app.get("name_ja", ""),
+            "status": "released" if app.get("bootstrap_visible") else "draft",
+            "category": app.get("category", "camera"),
+            "category_label": app.get("category_label", ""),
+            "description_ja": app.get("description_ja", ""),
+            "description_en": app.get("description_en", ""),
+            "icon_path": app.get("icon_path", ""),
+            "promo_image_path": app.get("fallback_image_path", ""),
+            "card_image_path": default_card_image_path(app),
+            "promo_image_source": "catalog",
+            "input_methods": methods,
+            "input_methods_label": input_methods_label(methods),
+            "support_path": app.get("support_path", ""),
+            "app_store_url": app.get("app_store_url", ""),
+            "bundle_id": app.get("bundle_id", ""),
+            "asc_app_id": app.get("asc_app_id", ""),
+            "is_health_app": default_is_health_app(app),
+            "release_date": normalize_release_date(app.get("release_date")),
+            "featured_priority": int(app.get("featured_priority", 999)),
+            "sort_order": int(app.get("sort_order", 999)),
+            "published_to_landing": bool(app.get("bootstrap_visible", False)),
+        },
+        "published_to_landing": as_bool(app.get("bootstrap_visible"), default=False),
     }
 
 
-def apply_catalog_defaults(entry: dict[str, Any], catalog_entry: dict[str, Any]) -> dict[str, Any]:
-    merged = default_output_entry(catalog_entry)
+def default_output_entry(app: dict[str, Any], defaults: dict[str, Any] | None = None) -> dict[str, Any]:
+    if defaults is None:
+        defaults = catalog_entry_defaults(app)
+    entry = dict(defaults["entry"])
+    entry["input_methods"] = list(entry["input_methods"])
+    entry["updated_at"] = now_iso()
+    return set_card_image_srcset(entry)
+
+
+@TIMINGS.timed("merge")
+def apply_catalog_defaults(
+    entry: dict[str, Any],
+    catalog_entry: dict[str, Any],
+    defaults: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    if defaults is None:
+        defaults = catalog_entry_defaults(catalog_entry)
+    default_entry = defaults["entry"]
+    merged = default_output_entry(catalog_entry, defaults)
     merged.update(entry)
 
-    if not merged.get("promo_image_path") and catalog_entry.get("fallback_image_path"):
-        merged["promo_image_path"] = catalog_entry["fallback_image_path"]
+    if not merged.get("promo_image_path") and default_entry["promo_image_path"]:
+        merged["promo_image_path"] = default_entry["promo_image_path"]
         merged["promo_image_source"] = "catalog"
 
     if not merged.get("card_image_path"):
-        merged["card_image_path"] = default_card_image_path(catalog_entry)
+        merged["card_image_path"] = default_entry["card_image_path"]
+    set_card_image_srcset(merged)
 
     merged_methods = parse_input_methods(
         merged.get("input_methods"),
-        fallback=default_input_methods(catalog_entry),
+        fallback=default_entry["input_methods"],
     )
     merged["input_methods"] = merged_methods
     merged["input_methods_label"] = input_methods_label(merged_methods)
 
-    merged["is_health_app"] = as_bool(merged.get("is_health_app"), default=default_is_health_app(catalog_entry))
+    merged["is_health_app"] = as_bool(merged.get("is_health_app"), default=default_entry["is_health_app"])
     merged["published_to_landing"] = as_bool(
         merged.get("published_to_landing"),
-        default=as_bool(catalog_entry.get("bootstrap_visible"), default=False),
+        default=defaults["published_to_landing"],
     )
 
     merged["release_date"] = normalize_release_date(merged.get("release_date"))
@@ -525,41 +1247,171 @@ def sort_entries(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return sorted(entries, key=lambda item: (int(item.get("sort_order", 999)), item.get("slug", "")))
 
 
-def output_payload(existing_output: dict[str, Any], source: str, apps: list[dict[str, Any]]) -> dict[str, Any]:
+def canonical_digest(value: Any) -> str:
+    canonical = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def entry_content_hash(entry: dict[str, Any]) -> str:
+    return canonical_digest(entry)
+
+
+def entry_digest(entry: dict[str, Any]) -> str:
+    return canonical_digest(entry_without_updated_at(entry))
+
+
+def output_digest(output: dict[str, Any]) -> str:
+    return canonical_digest({key: value for key, value in output.items() if key != "generated_at"})
+
+
+def build_state_digests(output: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "output": output_digest(output),
+        "entries": {
+            str(entry["slug"]): entry_digest(entry)
+            for entry in output.get("apps", [])
+            if isinstance(entry, dict) and "slug" in entry
+        },
+    }
+
+
+def state_digests(state: dict[str, Any]) -> dict[str, Any]:
+    digests = state.get("digests")
+    return digests if isinstance(digests, dict) else {}
+
+
+def output_payload(
+    existing_output: dict[str, Any],
+    source: str,
+    apps: list[dict[str, Any]],
+    *,
+    previous_digest: str | None = None,
+) -> dict[str, Any]:
     next_output = {
         "schema_version": 1,
         "generated_at": now_iso(),
         "source": source,
         "apps": sort_entries(apps),
     }
-    if (
-        existing_output.get("schema_version") == next_output["schema_version"]
-        and existing_output.get("source") == next_output["source"]
-        and existing_output.get("apps") == next_output["apps"]
-        and existing_output.get("generated_at")
-    ):
+    if not existing_output.get("generated_at"):
+        return next_output
+    if previous_digest is None:
+        previous_digest = output_digest(existing_output)
+    if previous_digest == output_digest(next_output):
         next_output["generated_at"] = existing_output["generated_at"]
     return next_output
 
 
+def save_sharded_output(shard_dir: Path, output: dict[str, Any]) -> bool:
+    manifest_path = shard_dir / "manifest.json"
+    apps_dir = shard_dir / "apps"
+    previous = load_json(manifest_path, {})
+    previous_hashes = {
+        item.get("slug"): item.get("hash")
+        for item in previous.get("apps", [])
+        if isinstance(item, dict)
+    }
+
+    changed = False
+    manifest_apps: list[dict[str, Any]] = []
+    for entry in output.get("apps", []):
+        slug = safe_slug(str(entry["slug"]))
+        content_hash = entry_content_hash(entry)
+        shard_path = apps_dir / f"{slug}.json"
+        if previous_hashes.get(slug) != content_hash or not shard_path.exists():
+            changed = save_json_if_changed(shard_path, entry) or changed
+        manifest_apps.append(
+            {
+                "slug": slug,
+                "status": entry.get("status", "unknown"),
+                "sort_order": int(entry.get("sort_order", 999)),
+                "hash": content_hash,
+                "path": f"apps/{slug}.json",
+            }
+        )
+
+    current_slugs = {item["slug"] for item in manifest_apps}
+    if apps_dir.exists():
+        for stale in apps_dir.glob("*.json"):
+            if stale.stem not in current_slugs:
+                stale.unlink()
+                changed = True
+
+    manifest = {
+        "schema_version": 1,
+        "generated_at": output.get("generated_at", now_iso()),
+        "source": output.get("source", ""),
+        "apps": manifest_apps,
+    }
+    return save_json_if_changed(manifest_path, manifest) or changed
+
+
+def save_published_output(publish_dir: Path, output: dict[str, Any], *, keep_previous: int = 1) -> bool:
+    minified = json.dumps(output, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    content_hash = sha256(minified).hexdigest()
+    name = f"landing-apps.{content_hash[:12]}.min.json"
+    versions_dir = publish_dir / "v"
+    pointer_path = publish_dir / "landing-apps.current.json"
+
+    # No .gz/.br siblings: Cloudflare Pages compresses on the fly and would not
+    # serve precompressed files with a Content-Encoding header.
+    changed = save_bytes_if_changed(versions_dir / name, minified)
+    pointer: dict[str, Any] = {
+        "schema_version": 1,
+        "path": f"v/{name}",
+        "sha256": content_hash,
+        "bytes": len(minified),
+    }
+
+    previous = load_json(pointer_path, {})
+    history = [pointer["path"]] + [
+        path for path in previous.get("history", [previous.get("path")]) if path and path != pointer["path"]
+    ]
+    pointer["history"] = history[: keep_previous + 1]
+    changed = save_json_if_changed(pointer_path, pointer) or changed
+
+    # Keep the previous fingerprint so clients holding the old pointer can still resolve it.
+    keep = {Path(path).name for path in pointer["history"]}
+    for stale in versions_dir.glob("landing-apps.*.min.json*"):
+        if stale.name not in keep:
+            stale.unlink()
+            changed = True
+    return changed
+
+
 def entry_without_updated_at(entry: dict[str, Any]) -> dict[str, Any]:
     return {key: value for key, value in entry.items() if key != "updated_at"}
 
 
-def keep_updated_at_if_semantically_same(entry: dict[str, Any], existing_entry: dict[str, Any] | None) -> dict[str, Any]:
-    if existing_entry and entry_without_updated_at(entry) == entry_without_updated_at(existing_entry):
+def keep_updated_at_if_semantically_same(
+    entry: dict[str, Any],
+    existing_entry: dict[str, Any] | None,
+    existing_digest: str | None = None,
+) -> dict[str, Any]:
+    if not existing_entry:
+        return entry
+    if existing_digest is None:
+        existing_digest = entry_digest(existing_entry)
+    if entry_digest(entry) == existing_digest:
         entry["updated_at"] = existing_entry.get("updated_at", entry.get("updated_at", now_iso()))
     return entry
 
 
-def ensure_bootstrap_data(catalog: dict[str, Any], existing_output: dict[str, Any]) -> dict[str, Any]:
+def ensure_bootstrap_data(
+    catalog: dict[str, Any],
+    existing_output: dict[str, Any],
+    *,
+    previous_digest: str | None = None,
+    compiled: CompiledCatalog | None = None,
+) -> dict[str, Any]:
+    defaults = compiled.defaults if compiled else {}
     apps: list[dict[str, Any]] = []
     for catalog_app in catalog.get("apps", []):
         if not catalog_app.get("bootstrap_visible"):
             continue
-        apps.append(default_output_entry(catalog_app))
+        apps.append(default_output_entry(catalog_app, defaults.get(catalog_app.get("slug"))))
 
-    return output_payload(existing_output, "bootstrap", apps)
+    return output_payload(existing_output, "bootstrap", apps, previous_digest=previous_digest)
 
 
 def normalize_lookup_country(country: str) -> str:
@@ -569,6 +1421,19 @@ def normalize_lookup_country(country: str) -> str:
     return normalized
 
 
+def parse_lookup_countries(value: str) -> list[str]:
+    countries = [normalize_lookup_country(item) for item in str(value).split(",") if item.strip()]
+    if not countries:
+        raise ValueError("at least one lookup country is required")
+    return dedupe_keep_order(countries)
+
+
+def chunk_values(values: list[str], size: int) -> list[list[str]]:
+    size = max(1, size)
+    return [values[index:index + size] for index in range(0, len(values), size)]
+
+
+@TIMINGS.timed("app_store_lookup")
 def fetch_app_store_lookup(app_ids: list[str], country: str) -> dict[str, dict[str, Any]]:
     if not app_ids:
         return {}
@@ -581,12 +1446,9 @@ def fetch_app_store_lookup(app_ids: list[str], country: str) -> dict[str, dict[s
         },
         safe=",",
     )
-    request = urllib.request.Request(
-        f"{APP_STORE_LOOKUP_URL}?{params}",
-        headers={"User-Agent": "allnew-landing-sync/1.0"},
-    )
-    with urllib.request.urlopen(request, timeout=APP_STORE_LOOKUP_TIMEOUT) as response:  # nosec: fixed Apple Lookup endpoint
-        payload = json.loads(response.read().decode("utf-8"))
+    body = HTTP_CLIENT.get(f"{APP_STORE_LOOKUP_URL}?{params}", timeout=APP_STORE_LOOKUP_TIMEOUT)
+    TIMINGS.add_bytes("app_store_lookup", len(body))
+    payload = json.loads(body.decode("utf-8"))
 
     results: dict[str, dict[str, Any]] = {}
     for item in payload.get("results", []):
@@ -598,13 +1460,117 @@ def fetch_app_store_lookup(app_ids: list[str], country: str) -> dict[str, dict[s
     return results
 
 
+def lookup_cache_path(cache_dir: Path, app_ids: list[str], country: str) -> Path:
+    digest = sha256(",".join(sorted(app_ids)).encode("utf-8")).hexdigest()[:24]
+    return cache_dir / f"{normalize_lookup_country(country)}-{digest}.json"
+
+
+def fetch_app_store_lookup_cached(
+    app_ids: list[str],
+    country: str,
+    *,
+    cache_dir: Path | None = None,
+    max_age: int = APP_STORE_LOOKUP_MAX_AGE,
+) -> dict[str, dict[str, Any]]:
+    if cache_dir is None or not app_ids:
+        return fetch_app_store_lookup(app_ids, country)
+
+    path = lookup_cache_path(cache_dir, app_ids, country)
+    try:
+        cached = load_json(path, None)
+    except (OSError, json.JSONDecodeError):
+        cached = None
+    if not isinstance(cached, dict) or not isinstance(cached.get("results"), dict):
+        cached = None
+
+    if cached and (max_age < 0 or time.time() - float(cached.get("fetched_at", 0)) < max_age):
+        return cached["results"]
+
+    try:
+        results = fetch_app_store_lookup(app_ids, country)
+    # URLError and socket timeouts are OSErrors; a reset mid-body can also surface as HTTPException.
+    except (OSError, http.client.HTTPException, json.JSONDecodeError) as error:
+        if not cached:
+            raise
+        # Stale-while-error: an old answer beats failing the whole reconcile.
+        print(f"[WARN] App Store Lookup failed for {country}; using cached response from {path.name}: {error}")
+        return cached["results"]
+
+    save_json_if_changed(
+        path,
+        {
+            "fetched_at": int(time.time()),
+            "country": normalize_lookup_country(country),
+            "app_ids": sorted(app_ids),
+            "results": results,
+        },
+    )
+    return results
+
+
+def fetch_app_store_lookups(
+    app_ids: list[str],
+    countries: list[str],
+    *,
+    chunk_size: int = APP_STORE_LOOKUP_CHUNK_SIZE,
+    workers: int = APP_STORE_LOOKUP_WORKERS,
+    cache_dir: Path | None = None,
+    max_age: int = APP_STORE_LOOKUP_MAX_AGE,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    jobs = [(country, chunk) for country in countries for chunk in chunk_values(app_ids, chunk_size)]
+    results: dict[str, dict[str, dict[str, Any]]] = {country: {} for country in countries}
+    if not jobs:
+        return results
+
+    # Results are merged in (country, chunk) submission order so output does not depend on timing.
+    max_workers = max(1, min(workers, len(jobs)))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lookup") as executor:
+        futures = [
+            (
+                country,
+                executor.submit(
+                    fetch_app_store_lookup_cached,
+                    chunk,
+                    country,
+                    cache_dir=cache_dir,
+                    max_age=max_age,
+                ),
+            )
+            for country, chunk in jobs
+        ]
+        for country, future in futures:
+            results[country].update(future.result())
+    if cache_dir is not None:
+        prune_lookup_cache(cache_dir, {lookup_cache_path(cache_dir, chunk, country) for country, chunk in jobs})
+    return results
+
+
+def prune_lookup_cache(cache_dir: Path, used: set[Path]) -> None:
+    """Delete lookup responses this run did not read or write.
+
+    File names depend on the app IDs in each chunk, so catalog, chunk size or
+    country changes orphan the old files, and the CI cache would carry them forever.
+    """
+    if not cache_dir.is_dir():
+        return
+    removed = 0
+    for path in cache_dir.glob("*.json"):
+        if path not in used:
+            path.unlink(missing_ok=True)
+            removed += 1
+    if removed:
+        print(f"[INFO] removed {removed} unused App Store Lookup cache file(s)")
+
+
 def build_entry_from_app_store(
     existing_entry: dict[str, Any] | None,
     catalog_entry: dict[str, Any],
     lookup_entry: dict[str, Any],
     country: str,
+    existing_digest: str | None = None,
+    defaults: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    entry = default_output_entry(catalog_entry)
+    entry = default_output_entry(catalog_entry, defaults)
     if existing_entry:
         entry.update(existing_entry)
 
@@ -639,9 +1605,9 @@ def build_entry_from_app_store(
         entry["release_date"] = normalize_release_date(lookup_entry.get("releaseDate")) or entry.get("release_date", "")
 
     entry["app_store_lookup_country"] = normalize_lookup_country(country)
-    entry = apply_catalog_defaults(entry, catalog_entry)
+    entry = apply_catalog_defaults(entry, catalog_entry, defaults)
     entry["updated_at"] = now_iso()
-    return keep_updated_at_if_semantically_same(entry, existing_entry)
+    return keep_updated_at_if_semantically_same(entry, existing_entry, existing_digest)
 
 
 def state_payload(
@@ -649,15 +1615,18 @@ def state_payload(
     statuses: dict[str, str],
     *,
     app_store_reconcile: dict[str, Any] | None = None,
+    output: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     next_state = {
         "schema_version": 1,
         "updated_at": now_iso(),
-        "processed_event_ids": current_state.get("processed_event_ids", []),
+        "processed_events": ProcessedEventIndex.from_state(current_state).to_state(),
         "statuses": statuses,
     }
     if app_store_reconcile is not None:
         next_state["app_store_reconcile"] = app_store_reconcile
+    if output is not None:
+        next_state["digests"] = build_state_digests(output)
 
     comparable_current = {
         key: value
@@ -680,36 +1649,63 @@ def update_from_app_store(
     state: dict[str, Any],
     existing_output: dict[str, Any],
     country: str,
+    *,
+    chunk_size: int = APP_STORE_LOOKUP_CHUNK_SIZE,
+    workers: int = APP_STORE_LOOKUP_WORKERS,
+    cache_dir: Path | None = None,
+    max_age: int = APP_STORE_LOOKUP_MAX_AGE,
+    compiled: CompiledCatalog | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
+    if compiled is None:
+        compiled = compile_catalog(catalog)
     existing_by_slug: dict[str, dict[str, Any]] = {
         app["slug"]: app for app in existing_output.get("apps", []) if isinstance(app, dict) and "slug" in app
     }
     catalog_apps = [app for app in catalog.get("apps", []) if isinstance(app, dict) and app.get("slug")]
-    app_ids = [str(app.get("asc_app_id")) for app in catalog_apps if app.get("asc_app_id")]
-    lookup_by_id = fetch_app_store_lookup(app_ids, country)
-    if app_ids and not lookup_by_id:
+    app_ids = dedupe_keep_order([str(app.get("asc_app_id")) for app in catalog_apps if app.get("asc_app_id")])
+    countries = parse_lookup_countries(country)
+    lookup_by_country = fetch_app_store_lookups(
+        app_ids,
+        countries,
+        chunk_size=chunk_size,
+        workers=workers,
+        cache_dir=cache_dir,
+        max_age=max_age,
+    )
+    if app_ids and not any(lookup_by_country.values()):
         raise RuntimeError("App Store Lookup returned no app results")
 
+    digests = state_digests(state)
+    entry_digests = digests.get("entries") or {}
     normalized_entries: list[dict[str, Any]] = []
     statuses: dict[str, str] = {}
-    public_app_ids = set(lookup_by_id.keys())
+    public_app_ids = {app_id for lookup_by_id in lookup_by_country.values() for app_id in lookup_by_id}
 
     for catalog_entry in catalog_apps:
         slug = str(catalog_entry["slug"])
         existing_entry = existing_by_slug.get(slug)
+        defaults = compiled.defaults.get(slug)
         app_id = str(catalog_entry.get("asc_app_id") or "")
-        lookup_entry = lookup_by_id.get(app_id)
+        lookup_country = next((item for item in countries if app_id in lookup_by_country[item]), "")
+        lookup_entry = lookup_by_country[lookup_country].get(app_id) if lookup_country else None
 
         if lookup_entry:
-            entry = build_entry_from_app_store(existing_entry, catalog_entry, lookup_entry, country)
+            entry = build_entry_from_app_store(
+                existing_entry,
+                catalog_entry,
+                lookup_entry,
+                lookup_country,
+                entry_digests.get(slug),
+                defaults,
+            )
         elif existing_entry and existing_entry.get("status") == "submitted":
-            entry = apply_catalog_defaults(dict(existing_entry), catalog_entry)
-            entry = keep_updated_at_if_semantically_same(entry, existing_entry)
+            entry = apply_catalog_defaults(dict(existing_entry), catalog_entry, defaults)
+            entry = keep_updated_at_if_semantically_same(entry, existing_entry, entry_digests.get(slug))
         else:
-            entry = default_output_entry(catalog_entry)
+            entry = default_output_entry(catalog_entry, defaults)
             entry["status"] = "draft"
             entry["published_to_landing"] = False
-            entry = keep_updated_at_if_semantically_same(entry, existing_entry)
+            entry = keep_updated_at_if_semantically_same(entry, existing_entry, entry_digests.get(slug))
             if app_id:
                 print(f"[INFO] app is not public in App Store Lookup: {slug} ({app_id})")
 
@@ -722,16 +1718,27 @@ def update_from_app_store(
         if entry.get("published_to_landing") and entry.get("status") in VISIBLE_STATUSES
     ]
 
-    next_output = output_payload(existing_output, "app_store_reconcile", filtered_entries)
-    next_state = state_payload(
-        state,
-        statuses,
-        app_store_reconcile={
-            "country": normalize_lookup_country(country),
-            "public_app_ids": sorted(public_app_ids),
-            "missing_app_ids": sorted(set(app_ids) - public_app_ids),
-        },
+    app_store_reconcile: dict[str, Any] = {
+        "country": countries[0],
+        "public_app_ids": sorted(public_app_ids),
+        "missing_app_ids": sorted(set(app_ids) - public_app_ids),
+    }
+    if len(countries) > 1:
+        app_store_reconcile["countries"] = {
+            item: {
+                "public_app_ids": sorted(lookup_by_country[item]),
+                "missing_app_ids": sorted(set(app_ids) - set(lookup_by_country[item])),
+            }
+            for item in countries
+        }
+
+    next_output = output_payload(
+        existing_output,
+        "app_store_reconcile",
+        filtered_entries,
+        previous_digest=digests.get("output"),
     )
+    next_state = state_payload(state, statuses, app_store_reconcile=app_store_reconcile, output=next_output)
     return next_output, next_state
 
 
@@ -778,8 +1785,10 @@ def build_entry_from_event(
     catalog_entry: dict[str, Any],
     payload: dict[str, Any],
     event_data: dict[str, Any],
+    screenshots: dict[tuple[str, str], ScreenshotResult] | None = None,
+    defaults: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    entry = default_output_entry(catalog_entry)
+    entry = default_output_entry(catalog_entry, defaults)
     if existing_entry:
         entry.update(existing_entry)
 
@@ -832,21 +1841,29 @@ def build_entry_from_event(
     if "release_date" in payload or "releaseDate" in payload:
         entry["release_date"] = normalize_release_date(payload.get("release_date") or payload.get("releaseDate"))
 
-    screenshot_url = payload.get("first_screenshot_url") or payload.get("promo_image_url")
+    screenshot_url = payload_screenshot_url(payload)
     if screenshot_url:
-        try:
-            relative_path, _changed = download_screenshot(screenshot_url, entry["slug"])
+        screenshot_key = (entry["slug"], screenshot_url)
+        if screenshots is None or screenshot_key not in screenshots:
+            screenshots = download_slug_screenshots(entry["slug"], [screenshot_url])
+        result = screenshots[screenshot_key]
+        if isinstance(result, Exception):
+            print(f"[WARN] screenshot download failed for {entry['slug']}: {result}")
+        else:
+            relative_path, _changed, srcset = result
             entry["promo_image_path"] = relative_path
             entry["promo_image_source"] = "asc_first_screenshot"
-        except (urllib.error.URLError, ValueError, RuntimeError) as error:
-            print(f"[WARN] screenshot download failed for {entry['slug']}: {error}")
+            if srcset:
+                entry["promo_image_srcset"] = srcset
+            else:
+                entry.pop("promo_image_srcset", None)
 
     if entry.get("status") == "released":
         resolved_release_date = pick_release_date_from_context(payload, event_data)
         if resolved_release_date:
             entry["release_date"] = resolved_release_date
 
-    entry = apply_catalog_defaults(entry, catalog_entry)
+    entry = apply_catalog_defaults(entry, catalog_entry, defaults)
 
     entry["updated_at"] = now_iso()
     return entry
@@ -857,19 +1874,25 @@ def update_from_event(
     state: dict[str, Any],
     existing_output: dict[str, Any],
     event_data: dict[str, Any],
+    *,
+    screenshot_workers: int = SCREENSHOT_DOWNLOAD_WORKERS,
+    screenshot_cache: ScreenshotCache | None = None,
+    processed_index: ProcessedEventIndex | None = None,
+    compiled: CompiledCatalog | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
-    by_slug, by_bundle, by_app_id = build_catalog_maps(catalog)
+    if compiled is None:
+        compiled = compile_catalog(catalog)
+    by_slug, by_bundle, by_app_id = compiled.by_slug, compiled.by_bundle, compiled.by_app_id
 
     entries_by_slug: dict[str, dict[str, Any]] = {
         app["slug"]: app for app in existing_output.get("apps", []) if isinstance(app, dict) and "slug" in app
     }
 
-    processed_ids = state.get("processed_event_ids", [])
-    if not isinstance(processed_ids, list):
-        processed_ids = []
+    if processed_index is None:
+        processed_index = ProcessedEventIndex.from_state(state)
 
     event_key = event_identity_key(event_data)
-    if event_key in processed_ids:
+    if event_key in processed_index:
         print(f"[INFO] event already processed: {event_key}")
         return existing_output, state
 
@@ -878,21 +1901,49 @@ def update_from_event(
         print("[WARN] no app payload found in event")
         return existing_output, state
 
-    resolved_any = False
-
+    resolved_payloads: list[tuple[str, dict[str, Any]]] = []
     for payload in payload_apps:
         slug = resolve_slug(payload, by_slug, by_bundle, by_app_id)
         if not slug:
             print(f"[WARN] could not resolve app slug for payload keys={sorted(payload.keys())}")
             continue
+        resolved_payloads.append((slug, payload))
+
+    if len({slug for slug, _payload in resolved_payloads}) > 1:
+        # A coalesced batch may already have applied this event for some apps before it stopped.
+        remaining = [
+            (slug, payload)
+            for slug, payload in resolved_payloads
+            if app_event_key(event_key, slug) not in processed_index
+        ]
+        if len(remaining) < len(resolved_payloads):
+            print(f"[INFO] event partially processed, resuming remaining apps: {event_key}")
+            resolved_payloads = remaining
+
+    screenshots = prefetch_screenshots(
+        [
+            (slug, payload_screenshot_url(payload))
+            for slug, payload in resolved_payloads
+            if payload_screenshot_url(payload)
+        ],
+        screenshot_workers,
+        screenshot_cache,
+    )
 
+    for slug, payload in resolved_payloads:
         catalog_entry = by_slug[slug]
         existing_entry = entries_by_slug.get(slug)
-        entry = build_entry_from_event(existing_entry, catalog_entry, payload, event_data)
+        entry = build_entry_from_event(
+            existing_entry,
+            catalog_entry,
+            payload,
+            event_data,
+            screenshots,
+            compiled.defaults.get(slug),
+        )
         entries_by_slug[slug] = entry
-        resolved_any = True
 
-    if not resolved_any:
+    if not resolved_payloads:
         print("[WARN] no resolvable app payload found in event")
         return existing_output, state
 
@@ -900,7 +1951,7 @@ def update_from_event(
     for slug, entry in entries_by_slug.items():
         catalog_entry = by_slug.get(slug)
         if catalog_entry:
-            normalized_entries.append(apply_catalog_defaults(entry, catalog_entry))
+            normalized_entries.append(apply_catalog_defaults(entry, catalog_entry, compiled.defaults.get(slug)))
         else:
             normalized_entries.append(entry)
 
@@ -910,16 +1961,31 @@ def update_from_event(
         if entry.get("published_to_landing") and entry.get("status") in VISIBLE_STATUSES
     ]
 
-    next_output = output_payload(existing_output, "event", filtered_entries)
+    next_output = output_payload(
+        existing_output,
+        "event",
+        filtered_entries,
+        previous_digest=state_digests(state).get("output"),
+    )
 
-    processed_ids.append(str(event_key))
-    processed_ids = processed_ids[-500:]
+    split_slugs = event_data.get("split_event_slugs") or {}
+    for member_key in event_data.get("coalesced_event_keys") or [event_key]:
+        member_key = str(member_key)
+        if member_key not in split_slugs:
+            processed_index.add(member_key)
+            continue
+        # An event split across apps is only done once every app's update has been applied.
+        for slug, _payload in resolved_payloads:
+            processed_index.add(app_event_key(member_key, slug))
+        if all(app_event_key(member_key, slug) in processed_index for slug in split_slugs[member_key]):
+            processed_index.add(member_key)
 
     next_state = {
         "schema_version": 1,
         "updated_at": now_iso(),
-        "processed_event_ids": processed_ids,
+        "processed_events": processed_index.to_state(),
         "statuses": {entry["slug"]: entry.get("status", "unknown") for entry in normalized_entries},
+        "digests": build_state_digests(next_output),
     }
     if "app_store_reconcile" in state:
         next_state["app_store_reconcile"] = state["app_store_reconcile"]
@@ -927,33 +1993,624 @@ def update_from_event(
     return next_output, next_state
 
 
-def main() -> int:
-    args = parse_args()
+def update_from_events(
+    catalog: dict[str, Any],
+    state: dict[str, Any],
+    existing_output: dict[str, Any],
+    events: list[dict[str, Any]],
+    *,
+    screenshot_workers: int = SCREENSHOT_DOWNLOAD_WORKERS,
+    screenshot_cache: ScreenshotCache | None = None,
+    compiled: CompiledCatalog | None = None,
+    coalesce_window: float = 0.0,
+    checkpoint: Callable[[dict[str, Any], dict[str, Any]], None] | None = None,
+    checkpoint_every: int = 0,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    next_output, next_state = existing_output, state
+    processed_index = ProcessedEventIndex.from_state(state)
+    if compiled is None:
+        compiled = compile_catalog(catalog)
+    events = coalesce_events(events, compiled, coalesce_window, processed_index)
+    for position, event_data in enumerate(events, start=1):
+        if checkpoint and checkpoint_every > 0 and position > 1 and (position - 1) % checkpoint_every == 0:
+            # Persist what is applied so far; a rerun then skips it via processed_events
+            # (per app for events split across apps, so no app's share is lost).
+            checkpoint(next_output, next_state)
+        next_output, next_state = update_from_event(
+            catalog,
+            next_state,
+            next_output,
+            event_data,
+            screenshot_workers=screenshot_workers,
+            screenshot_cache=screenshot_cache,
+            processed_index=processed_index,
+            compiled=compiled,
+        )
+    return next_output, next_state
+
+
+STATUS_PAYLOAD_FIELDS = ("status", "app_store_state", "appStoreState")
+# Fields whose mere presence changes the entry, so an explicit empty value must win.
+PRESENCE_PAYLOAD_FIELDS = {"release_date", "releaseDate", "is_health_app"}
+
+
+@dataclass
+class CoalescedGroup:
+    """Events for one resolved slug that fall inside one coalescing window."""
+
+    slug: str
+    started_at: datetime | None
+    members: list[tuple[str, dict[str, Any], dict[str, Any]]] = field(default_factory=list)
+
 
-    catalog = load_json(args.catalog, {"apps": []})
+def event_time(event_data: dict[str, Any]) -> datetime | None:
+    client_payload = event_data.get("client_payload", event_data)
+    if not isinstance(client_payload, dict):
+        client_payload = {}
+    candidates = [
+        client_payload.get("event_date"),
+        client_payload.get("eventDate"),
+        event_data.get("event_date"),
+        event_data.get("eventDate"),
+        event_data.get("created_at"),
+    ]
+    for candidate in candidates:
+        parsed = parse_iso_datetime(candidate)
+        if parsed:
+            return parsed
+    return None
+
+
+def merge_event_payloads(payloads: list[dict[str, Any]]) -> dict[str, Any]:
+    merged: dict[str, Any] = {}
+    status_payload: dict[str, Any] | None = None
+    for payload in payloads:
+        raw_status = payload.get("status") or payload.get("app_store_state") or payload.get("appStoreState")
+        if normalize_status(raw_status) != "unknown":
+            status_payload = payload
+        for key, value in payload.items():
+            if key in STATUS_PAYLOAD_FIELDS:
+                continue
+            if value in (None, "") and key not in PRESENCE_PAYLOAD_FIELDS:
+                continue
+            merged[key] = value
+    # Later events without a recognizable status must not clobber the latest known one.
+    if status_payload is not None:
+        for key in STATUS_PAYLOAD_FIELDS:
+            if key in status_payload:
+                merged[key] = status_payload[key]
+    return merged
+
+
+def app_event_key(event_key: str, slug: str) -> str:
+    return f"{event_key}#{slug}"
+
+
+def coalesced_event(group: CoalescedGroup, event_slugs: dict[str, list[str]]) -> dict[str, Any]:
+    if len(group.members) == 1:
+        _key, event_data, _payload = group.members[0]
+        if len(parse_event_payload(event_data)) == 1:
+            return event_data
+
+    latest_event = group.members[-1][1]
+    latest_client_payload = latest_event.get("client_payload", latest_event)
+    if not isinstance(latest_client_payload, dict):
+        latest_client_payload = {}
+    member_keys = dedupe_keep_order([key for key, _event, _payload in group.members])
+
+    client_payload = {key: latest_client_payload[key] for key in ("event_date", "eventDate") if key in latest_client_payload}
+    client_payload["apps"] = [merge_event_payloads([payload for _key, _event, payload in group.members])]
+    event_data = {key: latest_event[key] for key in ("event_date", "eventDate", "created_at") if key in latest_event}
+    digest = sha256("\n".join(member_keys).encode("utf-8")).hexdigest()[:16]
+    event_data["id"] = f"coalesced:{group.slug}:{digest}"
+    event_data["client_payload"] = client_payload
+    event_data["coalesced_event_keys"] = member_keys
+    split_slugs = {key: event_slugs[key] for key in member_keys if len(event_slugs[key]) > 1}
+    if split_slugs:
+        event_data["split_event_slugs"] = split_slugs
+    return event_data
+
+
+def coalesce_events(
+    events: list[dict[str, Any]],
+    compiled: CompiledCatalog,
+    window_seconds: float,
+    processed_index: ProcessedEventIndex | None = None,
+) -> list[dict[str, Any]]:
+    """Collapse events for the same resolved slug within ``window_seconds``.
+
+    Windows are measured on the event timestamps when present; events without
+    one join the slug's open window. Each merged update takes the position of
+    its first event. Events that cannot be fully resolved pass through
+    unchanged so update_from_event reports them as before, and close the open
+    windows of any slugs they do touch so no later event jumps ahead of them.
+
+    An event for several apps is split into one update per app, each recording
+    ``<event key>#<slug>`` as processed; a resumed batch only skips the apps
+    whose share was already applied.
+    """
+    if window_seconds <= 0 or len(events) < 2:
+        return events
+
+    items: list[dict[str, Any] | CoalescedGroup] = []
+    open_groups: dict[str, CoalescedGroup] = {}
+    seen_keys: set[str] = set()
+    event_slugs: dict[str, list[str]] = {}
+    duplicates = 0
+    for event_data in events:
+        event_key = event_identity_key(event_data)
+        if event_key in seen_keys or processed_index is not None and event_key in processed_index:
+            print(f"[INFO] event already processed: {event_key}")
+            duplicates += 1
+            continue
+        seen_keys.add(event_key)
+        resolved = [
+            (resolve_slug(payload, compiled.by_slug, compiled.by_bundle, compiled.by_app_id), payload)
+            for payload in parse_event_payload(event_data)
+        ]
+        if not resolved or any(slug is None for slug, _payload in resolved):
+            for slug, _payload in resolved:
+                open_groups.pop(slug, None)
+            items.append(event_data)
+            continue
+
+        event_slugs[event_key] = dedupe_keep_order([slug for slug, _payload in resolved])
+        if len(event_slugs[event_key]) > 1 and processed_index is not None:
+            remaining = [
+                (slug, payload)
+                for slug, payload in resolved
+                if app_event_key(event_key, slug) not in processed_index
+            ]
+            if len(remaining) < len(resolved):
+                print(f"[INFO] event partially processed, resuming remaining apps: {event_key}")
+            resolved = remaining
+
+        occurred_at = event_time(event_data)
+        for slug, payload in resolved:
+            group = open_groups.get(slug)
+            if (
+                group is None
+                or occurred_at is not None
+                and group.started_at is not None
+                and (occurred_at - group.started_at).total_seconds() > window_seconds
+            ):
+                group = CoalescedGroup(slug=slug, started_at=occurred_at)
+                open_groups[slug] = group
+                items.append(group)
+            elif group.started_at is None:
+                group.started_at = occurred_at
+            group.members.append((event_key, event_data, payload))
+
+    result: list[dict[str, Any]] = []
+    for item in items:
+        if isinstance(item, CoalescedGroup):
+            # ASC deliveries can arrive out of order; the latest event time wins.
+            if all(event_time(event) for _key, event, _payload in item.members):
+                item.members.sort(key=lambda member: event_time(member[1]))
+            result.append(coalesced_event(item, event_slugs))
+        else:
+            result.append(item)
+    merged = len(events) - duplicates - len(result)
+    if merged or duplicates:
+        print(
+            f"[INFO] coalesced {len(events) - duplicates} event(s) into {len(result)} update(s)"
+            f" ({merged} merged, {duplicates} duplicate(s) dropped)"
+        )
+    return result
+
+
+def load_event_batch(event_dir: Path | None, events_jsonl: Path | None) -> list[dict[str, Any]]:
+    events: list[dict[str, Any]] = []
+
+    if event_dir:
+        if not event_dir.is_dir():
+            raise RuntimeError(f"event directory not found: {event_dir}")
+        for path in sorted(event_dir.glob("*.json")):
+            event_data = load_json(path, {})
+            if isinstance(event_data, dict):
+                events.append(event_data)
+            else:
+                print(f"[WARN] skipping non-object event file: {path.name}")
+
+    if events_jsonl:
+        with events_jsonl.open("r", encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                text = line.strip()
+                if not text:
+                    continue
+                event_data = json.loads(text)
+                if isinstance(event_data, dict):
+                    events.append(event_data)
+                else:
+                    print(f"[WARN] skipping non-object event at line {line_number}: {events_jsonl}")
+
+    return events
+
+
+class LandingDaemon:
+    """Applies events against catalog, state and output kept resident in memory.
+
+    Events arrive as ``*.json`` files in a spool directory and/or as JSON lines
+    on a local Unix socket, and are applied on the main thread in arrival order
+    (after per-slug coalescing when ``coalesce_window`` is set).
+    Changes are flushed after ``idle_flush`` seconds without a new event, or at
+    most ``flush_interval`` seconds after the first unflushed one. Spool files
+    are deleted only after the flush that persisted them, so a crash replays
+    them (already-processed event keys are skipped as usual).
+    """
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.events: queue.Queue[tuple[dict[str, Any], Path | None]] = queue.Queue()
+        self.stop_requested = threading.Event()
+        recover_journal(args.journal)
+        self.compiled = load_compiled_catalog(args.catalog, args.compiled_catalog)
+        if not self.compiled.catalog.get("apps"):
+            raise RuntimeError(f"catalog has no apps: {args.catalog}")
+        self.catalog_mtime_ns = args.catalog.stat().st_mtime_ns
+        self.output = load_json(args.output, {})
+        self.state = load_json(args.state, {"schema_version": 1, "processed_events": {}, "statuses": {}})
+        self.processed_index = ProcessedEventIndex.from_state(self.state)
+        self.screenshot_cache = load_screenshot_cache(args.screenshot_validators, args.asset_hash_index)
+        self.spooled: set[Path] = set()
+        self.unflushed_spool: list[Path] = []
+        self.unflushed_events = 0
+        self.pending: list[tuple[dict[str, Any], Path | None]] = []
+        self.pending_since: float | None = None
+        self.dirty_since: float | None = None
+        self.last_event_at = 0.0
+
+    def reload_catalog_if_changed(self) -> None:
+        try:
+            mtime_ns = self.args.catalog.stat().st_mtime_ns
+            if mtime_ns == self.catalog_mtime_ns:
+                return
+            compiled = load_compiled_catalog(self.args.catalog, self.args.compiled_catalog)
+        except (OSError, json.JSONDecodeError) as error:
+            print(f"[WARN] keeping previous catalog, reload failed: {error}")
+            return
+        self.catalog_mtime_ns = mtime_ns
+        if not compiled.catalog.get("apps"):
+            print(f"[WARN] keeping previous catalog, reloaded catalog has no apps: {self.args.catalog}")
+            return
+        self.compiled = compiled
+        print(f"[INFO] catalog reloaded: {len(compiled.by_slug)} app(s)")
+
+    def scan_spool(self) -> None:
+        spool_dir = self.args.spool_dir
+        for path in sorted(spool_dir.glob("*.json")):
+            if path in self.spooled:
+                continue
+            try:
+                event_data = load_json(path, None)
+            except (OSError, json.JSONDecodeError) as error:
+                print(f"[WARN] rejecting spool file {path.name}: {error}")
+                path.replace(path.with_name(path.name + ".rejected"))
+                continue
+            if not isinstance(event_data, dict):
+                print(f"[WARN] rejecting non-object spool file: {path.name}")
+                path.replace(path.with_name(path.name + ".rejected"))
+                continue
+            self.spooled.add(path)
+            self.events.put((event_data, path))
+
+    def start_socket_server(self) -> socketserver.ThreadingUnixStreamServer:
+        socket_path = self.args.daemon_socket
+        if socket_path.is_socket():
+            socket_path.unlink()
+        events = self.events
+
+        class EventHandler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    text = line.strip()
+                    if not text:
+                        continue
+                    try:
+                        event_data = json.loads(text)
+                    except json.JSONDecodeError:
+                        self.wfile.write(b"error invalid json\n")
+                        continue
+                    if not isinstance(event_data, dict):
+                        self.wfile.write(b"error event must be an object\n")
+                        continue
+                    events.put((event_data, None))
+                    self.wfile.write(b"ok\n")
+
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        server = socketserver.ThreadingUnixStreamServer(str(socket_path), EventHandler)
+        server.daemon_threads = True
+        os.chmod(socket_path, 0o600)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def apply(self, event_data: dict[str, Any], spool_paths: list[Path]) -> None:
+        try:
+            with TIMINGS.stage("events"):
+                self.output, self.state = update_from_event(
+                    self.compiled.catalog,
+                    self.state,
+                    self.output,
+                    event_data,
+                    screenshot_workers=self.args.screenshot_workers,
+                    screenshot_cache=self.screenshot_cache,
+                    processed_index=self.processed_index,
+                    compiled=self.compiled,
+                )
+        except Exception as error:  # one bad event must not stop the daemon
+            print(f"[WARN] event failed: {error}")
+            for spool_path in spool_paths:
+                self.spooled.discard(spool_path)
+                if spool_path.exists():
+                    spool_path.replace(spool_path.with_name(spool_path.name + ".rejected"))
+            return
+        self.mark_dirty(spool_paths)
+
+    def mark_dirty(self, spool_paths: list[Path]) -> None:
+        now = time.monotonic()
+        self.last_event_at = now
+        if self.dirty_since is None:
+            self.dirty_since = now
+        self.unflushed_events += 1
+        self.unflushed_spool.extend(spool_paths)
+
+    def receive(self, event_data: dict[str, Any], spool_path: Path | None) -> None:
+        if self.pending_since is None:
+            self.pending_since = time.monotonic()
+        self.pending.append((event_data, spool_path))
+
+    def coalesce_due(self) -> bool:
+        if self.pending_since is None:
+            return False
+        return time.monotonic() - self.pending_since >= self.args.coalesce_window
+
+    def apply_pending(self) -> None:
+        pending, self.pending, self.pending_since = self.pending, [], None
+        spool_paths_by_key: dict[str, list[Path]] = {}
+        for event_data, spool_path in pending:
+            if spool_path:
+                spool_paths_by_key.setdefault(event_identity_key(event_data), []).append(spool_path)
+
+        events = coalesce_events(
+            [event_data for event_data, _spool_path in pending],
+            self.compiled,
+            self.args.coalesce_window,
+            self.processed_index,
+        )
+        for event_data in events:
+            member_keys = event_data.get("coalesced_event_keys") or [event_identity_key(event_data)]
+            spool_paths = [path for key in member_keys for path in spool_paths_by_key.pop(key, [])]
+            self.apply(event_data, spool_paths)
+
+        # Events dropped as already processed still need their spool files removed.
+        leftover = [path for paths in spool_paths_by_key.values() for path in paths]
+        if leftover:
+            self.mark_dirty(leftover)
+
+    def drain(self, timeout: float) -> None:
+        try:
+            event_data, spool_path = self.events.get(timeout=timeout) if timeout > 0 else self.events.get_nowait()
+        except queue.Empty:
+            return
+        self.receive(event_data, spool_path)
+        # Bound each drain so a steady stream still lets the loop coalesce, flush and rescan.
+        deadline = time.monotonic() + DAEMON_POLL_INTERVAL
+        while time.monotonic() < deadline:
+            try:
+                event_data, spool_path = self.events.get_nowait()
+            except queue.Empty:
+                return
+            self.receive(event_data, spool_path)
+
+    def flush_due(self) -> bool:
+        if self.dirty_since is None:
+            return False
+        now = time.monotonic()
+        return now - self.last_event_at >= self.args.idle_flush or now - self.dirty_since >= self.args.flush_interval
+
+    def flush(self) -> None:
+        if self.dirty_since is None:
+            return
+        changed = save_outputs(self.args, self.output, self.state, self.screenshot_cache)
+        for path in self.unflushed_spool:
+            path.unlink(missing_ok=True)
+            self.spooled.discard(path)
+        print(f"[INFO] flushed {self.unflushed_events} event(s) changed={str(changed).lower()}")
+        self.unflushed_spool.clear()
+        self.unflushed_events = 0
+        self.dirty_since = None
+
+    def serve(self) -> None:
+        if not self.args.spool_dir and not self.args.daemon_socket:
+            raise RuntimeError("--daemon requires --spool-dir and/or --daemon-socket")
+        if self.args.spool_dir:
+            self.args.spool_dir.mkdir(parents=True, exist_ok=True)
+
+        def request_stop(signum: int, _frame: Any) -> None:
+            print(f"[INFO] received signal {signum}, flushing and stopping")
+            self.stop_requested.set()
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+        server = self.start_socket_server() if self.args.daemon_socket else None
+        print(
+            f"[INFO] daemon ready: apps={len(self.compiled.by_slug)} "
+            f"spool_dir={self.args.spool_dir or '-'} socket={self.args.daemon_socket or '-'}"
+        )
+        try:
+            while not self.stop_requested.is_set():
+                self.reload_catalog_if_changed()
+                if self.args.spool_dir:
+                    self.scan_spool()
+                self.drain(DAEMON_POLL_INTERVAL)
+                if self.coalesce_due():
+                    self.apply_pending()
+                if self.flush_due():
+                    self.flush()
+        finally:
+            if server:
+                server.shutdown()
+                server.server_close()
+                self.args.daemon_socket.unlink(missing_ok=True)
+            while not self.events.empty():
+                self.drain(0)
+            if self.pending:
+                self.apply_pending()
+            self.flush()
+
+
+def run(args: argparse.Namespace) -> bool:
+    recover_journal(args.journal)
+    checkpoint_changed = False
+    with TIMINGS.stage("catalog_load"):
+        compiled = load_compiled_catalog(args.catalog, args.compiled_catalog)
+        catalog = compiled.catalog
     if not catalog.get("apps"):
         raise RuntimeError(f"catalog has no apps: {args.catalog}")
 
-    current_output = load_json(args.output, {})
-    current_state = load_json(args.state, {"schema_version": 1, "processed_event_ids": [], "statuses": {}})
+    with TIMINGS.stage("state_load"):
+        current_output = load_json(args.output, {})
+        current_state = load_json(args.state, {"schema_version": 1, "processed_events": {}, "statuses": {}})
+        screenshot_cache = load_screenshot_cache(args.screenshot_validators, args.asset_hash_index)
 
     if args.reconcile_app_store:
-        next_output, next_state = update_from_app_store(catalog, current_state, current_output, args.lookup_country)
+        with TIMINGS.stage("reconcile"):
+            next_output, next_state = update_from_app_store(
+                catalog,
+                current_state,
+                current_output,
+                args.lookup_country,
+                chunk_size=args.lookup_chunk_size,
+                workers=args.lookup_workers,
+                cache_dir=args.lookup_cache_dir,
+                max_age=args.max_lookup_age,
+                compiled=compiled,
+            )
+    elif args.event_dir or args.events_jsonl:
+        events = load_event_batch(args.event_dir, args.events_jsonl)
+        print(f"[INFO] applying {len(events)} event(s) in batch")
+
+        def checkpoint(output: dict[str, Any], state: dict[str, Any]) -> None:
+            nonlocal checkpoint_changed
+            with TIMINGS.stage("checkpoint"):
+                checkpoint_changed = any(save_output_and_state(args, output, state)) or checkpoint_changed
+
+        with TIMINGS.stage("events"):
+            next_output, next_state = update_from_events(
+                catalog,
+                current_state,
+                current_output,
+                events,
+                screenshot_workers=args.screenshot_workers,
+                screenshot_cache=screenshot_cache,
+                compiled=compiled,
+                coalesce_window=args.coalesce_window,
+                checkpoint=checkpoint,
+                checkpoint_every=args.checkpoint_every,
+            )
     elif args.bootstrap or not args.event_file:
-        next_output = ensure_bootstrap_data(catalog, current_output)
-        next_state = state_payload(
-            current_state,
-            {entry["slug"]: entry.get("status", "unknown") for entry in next_output["apps"]},
-        )
+        with TIMINGS.stage("bootstrap"):
+            next_output = ensure_bootstrap_data(
+                catalog,
+                current_output,
+                previous_digest=state_digests(current_state).get("output"),
+                compiled=compiled,
+            )
+            next_state = state_payload(
+                current_state,
+                {entry["slug"]: entry.get("status", "unknown") for entry in next_output["apps"]},
+                output=next_output,
+            )
     else:
         event_data = load_json(args.event_file, {})
-        next_output, next_state = update_from_event(catalog, current_state, current_output, event_data)
+        with TIMINGS.stage("events"):
+            next_output, next_state = update_from_event(
+                catalog,
+                current_state,
+                current_output,
+                event_data,
+                screenshot_workers=args.screenshot_workers,
+                screenshot_cache=screenshot_cache,
+                compiled=compiled,
+            )
+
+    return save_outputs(args, next_output, next_state, screenshot_cache) or checkpoint_changed
+
+
+def save_output_and_state(
+    args: argparse.Namespace,
+    next_output: dict[str, Any],
+    next_state: dict[str, Any],
+) -> tuple[bool, bool]:
+    """Write the output JSON and state as one journaled unit; returns which changed."""
+    output_content = stage_json_if_changed(args.output, next_output)
+    state_content = stage_json_if_changed(args.state, next_state)
+    writes = [
+        (path, content)
+        for path, content in ((args.output, output_content), (args.state, state_content))
+        if content is not None
+    ]
+    # Output and state are replaced together so processed events never disagree with the output.
+    if writes:
+        commit_journaled(args.journal, writes)
+    return output_content is not None, state_content is not None
+
+
+def save_outputs(
+    args: argparse.Namespace,
+    next_output: dict[str, Any],
+    next_state: dict[str, Any],
+    screenshot_cache: ScreenshotCache,
+) -> bool:
+    with TIMINGS.stage("save"):
+        output_changed, state_changed = save_output_and_state(args, next_output, next_state)
+        if args.shard_dir:
+            output_changed = save_sharded_output(args.shard_dir, next_output) or output_changed
+        if args.publish_dir:
+            output_changed = save_published_output(args.publish_dir, next_output) or output_changed
+        validators_changed = False
+        prune_content_store(screenshot_cache, next_output)
+        if screenshot_cache.validators["urls"] or args.screenshot_validators.exists():
+            validators_changed = save_json_if_changed(args.screenshot_validators, screenshot_cache.validators)
+        if screenshot_cache.asset_hashes["files"]:
+            prune_asset_hashes(screenshot_cache)
+            save_json_if_changed(args.asset_hash_index, screenshot_cache.asset_hashes)
+
+    return output_changed or state_changed or validators_changed
 
-    output_changed = save_json_if_changed(args.output, next_output)
-    state_changed = save_json_if_changed(args.state, next_state)
 
-    changed = output_changed or state_changed
+def main() -> int:
+    args = parse_args()
+    if args.daemon:
+        LandingDaemon(args).serve()
+        return 0
+
+    started = time.perf_counter()
+    if args.profile:
+        profiler = cProfile.Profile()
+        try:
+            changed = profiler.runcall(run, args)
+        finally:
+            args.profile.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(args.profile))
+    else:
+        changed = run(args)
+    TIMINGS.record("total", time.perf_counter() - started)
+
     print(f"changed={str(changed).lower()}")
+    if args.timings_json or args.profile:
+        print(f"timings={TIMINGS.summary()}")
+    if args.timings_json:
+        save_json_if_changed(
+            args.timings_json,
+            {
+                "generated_at": now_iso(),
+                "changed": changed,
+                "stages": TIMINGS.to_dict(),
+                "http": dict(HTTP_CLIENT.stats),
+            },
+        )
     return 0
 
 
@@ -12,22 +12,35 @@ from __future__ import annotations
 
 import argparse
 import base64
+import gc
 import hashlib
+import heapq
 import hmac
+import http.client
+import io
+import itertools
 import json
 import os
+import queue
+import random
+import signal
+import socket
+import sqlite3
+import ssl
+import sys
 import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
 DEFAULT_PATH = "/webhooks/asc"
+DEFAULT_HEALTH_PATH = "/healthz"
 DEFAULT_SIGNATURE_HEADER_CANDIDATES = (
     "X-Apple-Signature",
     "X-ASC-Signature",
@@ -50,7 +63,37 @@ RELEASED_STATES = {
 }
 DEFAULT_MAX_REQUEST_BYTES = 1024 * 1024
 DEFAULT_REPLAY_TTL_SECONDS = 3600
+DEFAULT_REPLAY_CACHE_SIZE = 100_000
+REPLAY_CACHE_STRIPES = 16
+REPLAY_STORES = ("memory", "sqlite")
+DEFAULT_REPLAY_DB = Path(__file__).resolve().parents[1] / "cache" / "asc_replay.sqlite3"
+REPLAY_DB_BUSY_TIMEOUT_MS = 5000
+REPLAY_DB_COMPACT_INTERVAL_SECONDS = 60.0
 DEFAULT_EVENT_FRESHNESS_SECONDS = 15 * 60
+DEFAULT_DISPATCH_WORKERS = 4
+DEFAULT_DISPATCH_QUEUE_SIZE = 1000
+DEFAULT_DISPATCH_RETRIES = 5
+DISPATCH_BACKOFF_SECONDS = 1.0
+DISPATCH_BACKOFF_MAX_SECONDS = 60.0
+DISPATCH_SHUTDOWN_GRACE_SECONDS = 10.0
+DEFAULT_RELAY_WORKERS = 1
+WORKER_RESTART_BACKOFF_SECONDS = 1.0
+WORKER_RESTART_BACKOFF_MAX_SECONDS = 30.0
+# A worker that stays up this long resets the restart backoff.
+WORKER_STABLE_SECONDS = 60.0
+RETRYABLE_DISPATCH_STATUSES = {429, 500, 502, 503, 504}
+GITHUB_API_HOST = "api.github.com"
+GITHUB_REQUEST_TIMEOUT_SECONDS = 20
+# GitHub closes idle keep-alive connections after roughly a minute.
+GITHUB_IDLE_CONNECTION_SECONDS = 50.0
+GITHUB_LATENCY_SAMPLES = 512
+# Errors that mean a reused keep-alive socket was already closed by the server.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
 
 
 @dataclass
@@ -68,6 +111,14 @@ class RelayConfig:
     max_request_bytes: int
     replay_ttl_seconds: int
     event_freshness_seconds: int
+    replay_cache_size: int = DEFAULT_REPLAY_CACHE_SIZE
+    replay_store: str = "memory"
+    replay_db: Path = DEFAULT_REPLAY_DB
+    health_path: str = DEFAULT_HEALTH_PATH
+    dispatch_workers: int = DEFAULT_DISPATCH_WORKERS
+    dispatch_queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE
+    dispatch_retries: int = DEFAULT_DISPATCH_RETRIES
+    workers: int = DEFAULT_RELAY_WORKERS
 
 
 def now_iso() -> str:
@@ -289,8 +340,378 @@ def build_normalized_payload(
     return normalized
 
 
-def send_repository_dispatch(config: RelayConfig, event_type: str, client_payload: dict[str, Any]) -> None:
-    url = f"https://api.github.com/repos/{config.github_owner}/{config.github_repo}/dispatches"
+class ReplayStripe:
+    """One shard of the replay cache: LRU-ordered entries plus an expiry heap."""
+
+    def __init__(self) -> None:
+        self.entries: OrderedDict[str, float] = OrderedDict()
+        self.expiry: list[tuple[float, str]] = []
+        self.lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def expire(self, now: float) -> int:
+        removed = 0
+        while self.expiry and self.expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(self.expiry)
+            # Heap items for evicted, forgotten or re-registered keys are stale.
+            if self.entries.get(key) == expires_at:
+                del self.entries[key]
+                removed += 1
+        self.counters["expirations"] += removed
+        return removed
+
+    def evict_oldest(self) -> bool:
+        if not self.entries:
+            return False
+        self.entries.popitem(last=False)
+        self.counters["evictions"] += 1
+        return True
+
+    def compact_heap(self) -> None:
+        self.expiry = [(expires_at, key) for key, expires_at in self.entries.items()]
+        heapq.heapify(self.expiry)
+
+
+class ReplayCache:
+    """Bounded duplicate-event filter with O(log n) expiry.
+
+    Keys are spread over ``REPLAY_CACHE_STRIPES`` independently locked shards.
+    Each shard expires entries from the top of a min-heap instead of scanning
+    every key. The total entry count is tracked across shards, and once it
+    reaches ``capacity`` the least recently seen key of the shard being written
+    is evicted, so a replay storm cannot grow memory past ``capacity``.
+    """
+
+    def __init__(self, capacity: int, stripes: int = REPLAY_CACHE_STRIPES) -> None:
+        self.capacity = max(1, capacity)
+        self.stripes = [ReplayStripe() for _ in range(stripes)]
+        self.size = 0
+        self.size_lock = threading.Lock()
+
+    def stripe(self, event_id: str) -> ReplayStripe:
+        return self.stripes[hash(event_id) % len(self.stripes)]
+
+    def adjust_size(self, delta: int) -> int:
+        with self.size_lock:
+            self.size += delta
+            return self.size
+
+    def register(self, event_id: str, ttl_seconds: int) -> bool:
+        """Record ``event_id`` and return False if it was already seen within the TTL."""
+        now = time.time()
+        stripe = self.stripe(event_id)
+        with stripe.lock:
+            removed = stripe.expire(now)
+            if removed:
+                self.adjust_size(-removed)
+            if event_id in stripe.entries:
+                stripe.entries.move_to_end(event_id)
+                stripe.counters["hits"] += 1
+                return False
+
+            stripe.counters["misses"] += 1
+            expires_at = now + ttl_seconds
+            stripe.entries[event_id] = expires_at
+            heapq.heappush(stripe.expiry, (expires_at, event_id))
+            over_capacity = self.adjust_size(1) > self.capacity
+            # The new key is the newest entry, so it is never the one evicted here.
+            if over_capacity and len(stripe.entries) > 1 and stripe.evict_oldest():
+                self.adjust_size(-1)
+                over_capacity = False
+            if len(stripe.expiry) > 2 * max(len(stripe.entries), 1024):
+                stripe.compact_heap()
+
+        if over_capacity:
+            # This shard held only the new key; evict from another one instead.
+            self.evict_elsewhere(stripe)
+        return True
+
+    def evict_elsewhere(self, skip: ReplayStripe) -> None:
+        for stripe in sorted(self.stripes, key=lambda item: len(item.entries), reverse=True):
+            if stripe is skip:
+                continue
+            with stripe.lock:
+                if stripe.evict_oldest():
+                    self.adjust_size(-1)
+                    return
+
+    def forget(self, event_id: str) -> None:
+        stripe = self.stripe(event_id)
+        with stripe.lock:
+            if stripe.entries.pop(event_id, None) is not None:
+                self.adjust_size(-1)
+
+    def stats(self) -> dict[str, Any]:
+        totals = {"store": "memory", "size": 0, "capacity": self.capacity, "hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        for stripe in self.stripes:
+            with stripe.lock:
+                totals["size"] += len(stripe.entries)
+                for name, value in stripe.counters.items():
+                    totals[name] += value
+        return totals
+
+    def mark_dispatched(self, event_id: str) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SqliteReplayStore:
+    """Replay filter persisted in SQLite (WAL) so it survives restarts.
+
+    Several relay processes on one host can share the database file: the
+    check-and-record step is a single upsert, which SQLite serializes across
+    processes, so exactly one of them accepts a given ``event_id``. Expired
+    rows are deleted in bulk at most once per compaction interval.
+
+    Rows start as pending (owned by the accepting process) and are marked
+    dispatched once GitHub accepted the event. Pending rows left behind by a
+    process that is no longer running are released on startup, so the
+    sender's redelivery of an event that never reached GitHub is accepted.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            str(path),
+            timeout=REPLAY_DB_BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(f"PRAGMA busy_timeout={REPLAY_DB_BUSY_TIMEOUT_MS}")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS replay ("
+            "event_id TEXT PRIMARY KEY, expires_at REAL NOT NULL, "
+            "owner INTEGER NOT NULL DEFAULT 0, dispatched INTEGER NOT NULL DEFAULT 1) WITHOUT ROWID"
+        )
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(replay)")}
+        if "owner" not in columns:
+            self.connection.execute("ALTER TABLE replay ADD COLUMN owner INTEGER NOT NULL DEFAULT 0")
+        if "dispatched" not in columns:
+            self.connection.execute("ALTER TABLE replay ADD COLUMN dispatched INTEGER NOT NULL DEFAULT 1")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS replay_expires_at ON replay (expires_at)")
+        self.pid = os.getpid()
+        self.next_compaction = 0.0
+        self.counters = {"hits": 0, "misses": 0, "expirations": 0, "compactions": 0, "released": 0}
+        self.release_orphaned()
+
+    def release_orphaned(self) -> None:
+        """Forget pending ids whose accepting process died before dispatching them."""
+        with self.lock:
+            owners = [row[0] for row in self.connection.execute("SELECT DISTINCT owner FROM replay WHERE dispatched = 0")]
+            released = 0
+            for owner in owners:
+                # Our own pid here is a reused pid from an earlier process.
+                if owner == self.pid or not process_alive(owner):
+                    released += self.connection.execute(
+                        "DELETE FROM replay WHERE dispatched = 0 AND owner = ?",
+                        (owner,),
+                    ).rowcount
+            self.counters["released"] += released
+        if released:
+            print(f"[INFO] released {released} undispatched replay entr{'y' if released == 1 else 'ies'} from {self.path}")
+
+    def compact(self, now: float) -> None:
+        removed = self.connection.execute("DELETE FROM replay WHERE expires_at <= ?", (now,)).rowcount
+        self.counters["compactions"] += 1
+        self.counters["expirations"] += max(0, removed)
+        self.next_compaction = now + REPLAY_DB_COMPACT_INTERVAL_SECONDS
+
+    def register(self, event_id: str, ttl_seconds: int) -> bool:
+        """Record ``event_id`` and return False if it was already seen within the TTL."""
+        now = time.time()
+        with self.lock:
+            if now >= self.next_compaction:
+                self.compact(now)
+            # Inserts a new id or revives an expired row; a live row is left alone.
+            inserted = self.connection.execute(
+                "INSERT INTO replay (event_id, expires_at, owner, dispatched) VALUES (?, ?, ?, 0) "
+                "ON CONFLICT (event_id) DO UPDATE SET expires_at = excluded.expires_at, "
+                "owner = excluded.owner, dispatched = 0 "
+                "WHERE replay.expires_at <= ?",
+                (event_id, now + ttl_seconds, self.pid, now),
+            ).rowcount
+            self.counters["misses" if inserted else "hits"] += 1
+            return bool(inserted)
+
+    def forget(self, event_id: str) -> None:
+        with self.lock:
+            self.connection.execute("DELETE FROM replay WHERE event_id = ?", (event_id,))
+
+    def mark_dispatched(self, event_id: str) -> None:
+        with self.lock:
+            self.connection.execute("UPDATE replay SET dispatched = 1 WHERE event_id = ?", (event_id,))
+
+    def stats(self) -> dict[str, Any]:
+        with self.lock:
+            size, pending = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(dispatched = 0), 0) FROM replay"
+            ).fetchone()
+            return {"store": "sqlite", "path": str(self.path), "size": size, "pending": pending, **self.counters}
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+def open_replay_store(config: RelayConfig) -> ReplayCache | SqliteReplayStore:
+    if config.replay_store == "sqlite":
+        return SqliteReplayStore(config.replay_db)
+    return ReplayCache(config.replay_cache_size)
+
+
+class GitHubClient:
+    """Keep-alive HTTPS connections to the GitHub API shared by dispatch workers.
+
+    At most ``max_connections`` requests run at once and idle connections are
+    reused, so a burst of events pays TCP and TLS setup once per connection
+    instead of once per event. A pooled socket the server already closed is
+    replaced transparently; every other failure is left to the caller's retry
+    policy. Errors are raised as ``HTTPError`` / ``URLError`` like ``urlopen``.
+    """
+
+    def __init__(self, max_connections: int, host: str = GITHUB_API_HOST) -> None:
+        self.host = host
+        self.max_connections = max(1, max_connections)
+        self.ssl_context = ssl.create_default_context()
+        self.idle: list[tuple[http.client.HTTPSConnection, float]] = []
+        self.limit = threading.BoundedSemaphore(self.max_connections)
+        self.lock = threading.Lock()
+        self.latencies_ms: deque[float] = deque(maxlen=GITHUB_LATENCY_SAMPLES)
+        self.counters = {
+            "requests": 0,
+            "errors": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "stale_reconnects": 0,
+        }
+
+    def new_connection(self) -> http.client.HTTPSConnection:
+        with self.lock:
+            self.counters["connections_opened"] += 1
+        return http.client.HTTPSConnection(
+            self.host,
+            timeout=GITHUB_REQUEST_TIMEOUT_SECONDS,
+            context=self.ssl_context,
+        )
+
+    def checkout(self) -> tuple[http.client.HTTPSConnection, bool]:
+        now = time.monotonic()
+        with self.lock:
+            while self.idle:
+                connection, idle_since = self.idle.pop()
+                if now - idle_since < GITHUB_IDLE_CONNECTION_SECONDS:
+                    self.counters["connections_reused"] += 1
+                    return connection, True
+                connection.close()
+        return self.new_connection(), False
+
+    def checkin(self, connection: http.client.HTTPSConnection) -> None:
+        with self.lock:
+            if len(self.idle) < self.max_connections:
+                self.idle.append((connection, time.monotonic()))
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for connection, _idle_since in idle:
+            connection.close()
+
+    def exchange(
+        self,
+        connection: http.client.HTTPSConnection,
+        path: str,
+        body: bytes,
+        headers: dict[str, str],
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        connection.request("POST", path, body=body, headers=headers)
+        response = connection.getresponse()
+        return response, response.read()
+
+    def post(self, path: str, body: bytes, headers: dict[str, str]) -> tuple[int, bytes]:
+        """POST ``body`` and return ``(status, response_body)`` for a 2xx response."""
+        url = f"https://{self.host}{path}"
+        with self.limit:
+            started = time.perf_counter()
+            connection, reused = self.checkout()
+            try:
+                try:
+                    response, payload = self.exchange(connection, path, body, headers)
+                except STALE_CONNECTION_ERRORS:
+                    connection.close()
+                    if not reused:
+                        raise
+                    with self.lock:
+                        self.counters["stale_reconnects"] += 1
+                    connection = self.new_connection()
+                    response, payload = self.exchange(connection, path, body, headers)
+            except (OSError, http.client.HTTPException) as error:
+                connection.close()
+                self.record(started, failed=True)
+                raise URLError(error) from error
+
+            if response.will_close:
+                connection.close()
+            else:
+                self.checkin(connection)
+            self.record(started, failed=not 200 <= response.status < 300)
+
+        if not 200 <= response.status < 300:
+            raise HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(payload))
+        return response.status, payload
+
+    def record(self, started: float, *, failed: bool) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self.lock:
+            self.counters["requests"] += 1
+            if failed:
+                self.counters["errors"] += 1
+            self.latencies_ms.append(elapsed_ms)
+
+    def stats(self) -> dict[str, Any]:
+        with self.lock:
+            samples = sorted(self.latencies_ms)
+            idle = len(self.idle)
+            counters = dict(self.counters)
+
+        def percentile(fraction: float) -> float:
+            if not samples:
+                return 0.0
+            return round(samples[min(len(samples) - 1, int(fraction * len(samples)))], 1)
+
+        return {
+            **counters,
+            "idle_connections": idle,
+            "max_connections": self.max_connections,
+            "latency_ms_p50": percentile(0.5),
+            "latency_ms_p95": percentile(0.95),
+            "latency_ms_max": round(samples[-1], 1) if samples else 0.0,
+        }
+
+
+def send_repository_dispatch(
+    client: GitHubClient,
+    config: RelayConfig,
+    event_type: str,
+    client_payload: dict[str, Any],
+) -> None:
     body = json.dumps(
         {
             "event_type": event_type,
@@ -298,10 +719,9 @@ def send_repository_dispatch(config: RelayConfig, event_type: str, client_payloa
         }
     ).encode("utf-8")
 
-    request = Request(
-        url,
-        data=body,
-        method="POST",
+    status, _payload = client.post(
+        f"/repos/{config.github_owner}/{config.github_repo}/dispatches",
+        body,
         headers={
             "Accept": "application/vnd.github+json",
             "Authorization": f"Bearer {config.github_token}",
@@ -309,24 +729,189 @@ def send_repository_dispatch(config: RelayConfig, event_type: str, client_payloa
             "User-Agent": "allnew-asc-webhook-relay/1.0",
         },
     )
+    if status not in {204, 201, 200}:
+        raise RuntimeError(f"unexpected GitHub response status={status}")
+
+
+def is_retryable_dispatch_error(error: Exception) -> bool:
+    if isinstance(error, HTTPError):
+        return error.code in RETRYABLE_DISPATCH_STATUSES
+    return isinstance(error, (URLError, RuntimeError, OSError))
+
+
+@dataclass
+class DispatchJob:
+    event_id: str
+    event_type: str
+    payload: dict[str, Any]
+    enqueued_at: float = field(default_factory=time.monotonic)
+    seq: int = 0
+    attempts: int = 0
+
+
+class DispatchQueue:
+    """Bounded queue drained by a fixed pool of GitHub dispatch workers.
+
+    The request handler only enqueues, so webhook latency no longer depends on
+    the GitHub API. Retryable failures (connection errors, 429/5xx) back off
+    with full jitter inside the worker; a job that exhausts its retries, or is
+    still undispatched when the relay stops, is handed to ``on_drop`` so the
+    sender's redelivery is accepted. ``on_dispatched`` runs after GitHub
+    accepted the event.
+    """
+
+    def __init__(
+        self,
+        config: RelayConfig,
+        *,
+        on_drop: Callable[[str], None] | None = None,
+        on_dispatched: Callable[[str], None] | None = None,
+    ) -> None:
+        self.config = config
+        self.on_drop = on_drop
+        self.on_dispatched = on_dispatched
+        self.github = GitHubClient(max_connections=config.dispatch_workers)
+        self.jobs: queue.Queue[DispatchJob] = queue.Queue(maxsize=max(1, config.dispatch_queue_size))
+        # Queued and in-flight jobs in submission order.
+        self.pending: OrderedDict[int, DispatchJob] = OrderedDict()
+        self.sequence = itertools.count(1)
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.workers: list[threading.Thread] = []
+        self.in_flight = 0
+        self.counters = {"accepted": 0, "rejected_full": 0, "dispatched": 0, "retried": 0, "failed": 0}
+
+    def start(self) -> None:
+        for index in range(max(1, self.config.dispatch_workers)):
+            worker = threading.Thread(target=self.run_worker, name=f"dispatch-{index + 1}", daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+    def submit(self, job: DispatchJob) -> bool:
+        with self.lock:
+            job.seq = next(self.sequence)
+            try:
+                self.jobs.put_nowait(job)
+            except queue.Full:
+                self.counters["rejected_full"] += 1
+                return False
+            self.pending[job.seq] = job
+            self.counters["accepted"] += 1
+        return True
+
+    def retry_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(DISPATCH_BACKOFF_MAX_SECONDS, DISPATCH_BACKOFF_SECONDS * (2**attempt)))
+
+    def run_worker(self) -> None:
+        while True:
+            try:
+                job = self.jobs.get(timeout=0.5)
+            except queue.Empty:
+                if self.stopping.is_set():
+                    return
+                continue
+            with self.lock:
+                self.in_flight += 1
+            try:
+                self.dispatch(job)
+            finally:
+                with self.lock:
+                    self.in_flight -= 1
+                    self.pending.pop(job.seq, None)
+                self.jobs.task_done()
+
+    def dispatch(self, job: DispatchJob) -> None:
+        while True:
+            job.attempts += 1
+            try:
+                send_repository_dispatch(self.github, self.config, job.event_type, job.payload)
+            except Exception as error:  # noqa: BLE001 - a worker must survive any send failure
+                if is_retryable_dispatch_error(error) and job.attempts <= self.config.dispatch_retries:
+                    with self.lock:
+                        self.counters["retried"] += 1
+                    delay = self.retry_delay(job.attempts - 1)
+                    print(
+                        f"[WARN] dispatch {job.event_id} failed (attempt {job.attempts}): {error}; "
+                        f"retrying in {delay:.1f}s"
+                    )
+                    if self.stopping.wait(delay):
+                        # Shutting down: one last attempt instead of a full backoff schedule.
+                        job.attempts = self.config.dispatch_retries
+                    continue
+                with self.lock:
+                    self.counters["failed"] += 1
+                print(f"[ERROR] failed to dispatch GitHub event {job.event_id} after {job.attempts} attempt(s): {error}")
+                if self.on_drop:
+                    self.on_drop(job.event_id)
+                return
+            with self.lock:
+                self.counters["dispatched"] += 1
+            if self.on_dispatched:
+                self.on_dispatched(job.event_id)
+            return
 
-    with urlopen(request, timeout=20) as response:  # nosec: fixed GitHub API URL
-        if response.status not in {204, 201, 200}:
-            raise RuntimeError(f"unexpected GitHub response status={response.status}")
+    def stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        with self.lock:
+            oldest_job = next(iter(self.pending.values()), None)
+            oldest = oldest_job.enqueued_at if oldest_job else None
+            return {
+                "queue_depth": self.jobs.qsize(),
+                "queue_capacity": self.jobs.maxsize,
+                "in_flight": self.in_flight,
+                "workers": len(self.workers),
+                "oldest_pending_age_seconds": round(now - oldest, 3) if oldest is not None else 0.0,
+                **self.counters,
+            }
+
+    def stop(self, timeout: float = DISPATCH_SHUTDOWN_GRACE_SECONDS) -> None:
+        """Let workers drain what is queued, then return after ``timeout`` at most."""
+        self.stopping.set()
+        deadline = time.monotonic() + timeout
+        for worker in self.workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+        self.github.close()
+        with self.lock:
+            remaining = list(self.pending.values())
+            self.pending.clear()
+        if remaining:
+            print(f"[WARN] relay stopped with {len(remaining)} undispatched event(s); releasing their replay entries")
+            if self.on_drop:
+                for job in remaining:
+                    self.on_drop(job.event_id)
+
+
+class ReusePortHTTPServer(ThreadingHTTPServer):
+    """Threading server whose listening socket sets SO_REUSEPORT.
+
+    Each pre-forked worker binds its own socket to the same address and the
+    kernel spreads incoming connections across them.
+    """
+
+    def server_bind(self) -> None:
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
 
 
 class RelayHandler(BaseHTTPRequestHandler):
     config: RelayConfig
     slug_by_app_id: dict[str, str]
     slug_by_bundle: dict[str, str]
-    replay_cache: dict[str, float] = {}
-    replay_cache_lock = threading.Lock()
-
-    def _write_json(self, status: int, payload: dict[str, Any]) -> None:
+    replay_cache: ReplayCache | SqliteReplayStore
+    dispatch_queue: DispatchQueue
+
+    def _write_json(
+        self,
+        status: int,
+        payload: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> None:
         body = (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.end_headers()
         self.wfile.write(body)
 
@@ -340,18 +925,35 @@ class RelayHandler(BaseHTTPRequestHandler):
 
     @classmethod
     def register_event(cls, event_id: str, ttl_seconds: int) -> bool:
-        now = time.time()
-        with cls.replay_cache_lock:
-            expired = [key for key, expires_at in cls.replay_cache.items() if expires_at <= now]
-            for key in expired:
-                cls.replay_cache.pop(key, None)
+        return cls.replay_cache.register(event_id, ttl_seconds)
 
-            existing_expires = cls.replay_cache.get(event_id)
-            if existing_expires and existing_expires > now:
-                return False
+    @classmethod
+    def forget_event(cls, event_id: str) -> None:
+        try:
+            cls.replay_cache.forget(event_id)
+        except sqlite3.Error as error:
+            print(f"[WARN] failed to release replay entry {event_id}: {error}")
+
+    @classmethod
+    def mark_event_dispatched(cls, event_id: str) -> None:
+        try:
+            cls.replay_cache.mark_dispatched(event_id)
+        except sqlite3.Error as error:
+            print(f"[WARN] failed to mark replay entry {event_id} dispatched: {error}")
 
-            cls.replay_cache[event_id] = now + ttl_seconds
-            return True
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path != self.config.health_path:
+            self._write_json(HTTPStatus.NOT_FOUND, {"ok": False, "error": "not found"})
+            return
+        self._write_json(
+            HTTPStatus.OK,
+            {
+                "ok": True,
+                "dispatch": self.dispatch_queue.stats(),
+                "github": self.dispatch_queue.github.stats(),
+                "replay": self.replay_cache.stats(),
+            },
+        )
 
     def do_POST(self) -> None:  # noqa: N802
         if self.path != self.config.path:
@@ -414,22 +1016,33 @@ class RelayHandler(BaseHTTPRequestHandler):
             self._write_json(HTTPStatus.BAD_REQUEST, {"ok": False, "error": "invalid or stale event_date"})
             return
 
-        if not self.register_event(event_id, self.config.replay_ttl_seconds):
+        try:
+            registered = self.register_event(event_id, self.config.replay_ttl_seconds)
+        except sqlite3.Error as error:
+            print(f"[ERROR] replay store unavailable: {error}")
+            self._write_json(
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                {"ok": False, "error": "replay store unavailable"},
+                headers={"Retry-After": "30"},
+            )
+            return
+        if not registered:
             self._write_json(HTTPStatus.CONFLICT, {"ok": False, "error": "duplicate event"})
             return
 
         event_type = pick_dispatch_event(normalized["app"].get("normalized_status", "unknown"))
 
-        try:
-            send_repository_dispatch(self.config, event_type, normalized)
-        except (HTTPError, URLError, RuntimeError) as error:
-            print(f"[ERROR] failed to dispatch GitHub event: {error}")
+        if not self.dispatch_queue.submit(DispatchJob(event_id, event_type, normalized)):
+            # Let the sender's retry through once the queue has room again.
+            self.forget_event(event_id)
+            print(f"[WARN] dispatch queue full; rejecting event {event_id}")
             self._write_json(
-                HTTPStatus.BAD_GATEWAY,
+                HTTPStatus.SERVICE_UNAVAILABLE,
                 {
                     "ok": False,
-                    "error": "upstream dispatch failed",
+                    "error": "dispatch queue full",
                 },
+                headers={"Retry-After": "30"},
             )
             return
 
@@ -439,6 +1052,7 @@ class RelayHandler(BaseHTTPRequestHandler):
                 "ok": True,
                 "event_type": event_type,
                 "event_id": event_id,
+                "queued": True,
             },
         )
 
@@ -487,6 +1101,44 @@ def parse_args() -> argparse.Namespace:
         type=int,
         default=parse_positive_int(os.getenv("ASC_EVENT_FRESHNESS_SECONDS", str(DEFAULT_EVENT_FRESHNESS_SECONDS)), DEFAULT_EVENT_FRESHNESS_SECONDS),
     )
+    parser.add_argument(
+        "--replay-cache-size",
+        type=int,
+        default=parse_positive_int(os.getenv("ASC_REPLAY_CACHE_SIZE", str(DEFAULT_REPLAY_CACHE_SIZE)), DEFAULT_REPLAY_CACHE_SIZE),
+    )
+    parser.add_argument(
+        "--replay-store",
+        choices=REPLAY_STORES,
+        default=os.getenv("ASC_REPLAY_STORE", "memory"),
+        help="memory: per-process cache; sqlite: persisted and shared by processes on this host",
+    )
+    parser.add_argument(
+        "--replay-db",
+        type=Path,
+        default=Path(os.getenv("ASC_REPLAY_DB", str(DEFAULT_REPLAY_DB))),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=parse_positive_int(os.getenv("ASC_RELAY_WORKERS", str(DEFAULT_RELAY_WORKERS)), DEFAULT_RELAY_WORKERS),
+        help="Pre-forked relay processes sharing the port via SO_REUSEPORT",
+    )
+    parser.add_argument("--health-path", default=os.getenv("ASC_RELAY_HEALTH_PATH", DEFAULT_HEALTH_PATH))
+    parser.add_argument(
+        "--dispatch-workers",
+        type=int,
+        default=parse_positive_int(os.getenv("ASC_DISPATCH_WORKERS", str(DEFAULT_DISPATCH_WORKERS)), DEFAULT_DISPATCH_WORKERS),
+    )
+    parser.add_argument(
+        "--dispatch-queue-size",
+        type=int,
+        default=parse_positive_int(os.getenv("ASC_DISPATCH_QUEUE_SIZE", str(DEFAULT_DISPATCH_QUEUE_SIZE)), DEFAULT_DISPATCH_QUEUE_SIZE),
+    )
+    parser.add_argument(
+        "--dispatch-retries",
+        type=int,
+        default=int(os.getenv("ASC_DISPATCH_RETRIES", str(DEFAULT_DISPATCH_RETRIES))),
+    )
 
     return parser.parse_args()
 
@@ -514,15 +1166,30 @@ def main() -> int:
         max_request_bytes=parse_positive_int(args.max_request_bytes, DEFAULT_MAX_REQUEST_BYTES),
         replay_ttl_seconds=parse_positive_int(args.replay_ttl_seconds, DEFAULT_REPLAY_TTL_SECONDS),
         event_freshness_seconds=parse_positive_int(args.event_freshness_seconds, DEFAULT_EVENT_FRESHNESS_SECONDS),
+        replay_cache_size=parse_positive_int(args.replay_cache_size, DEFAULT_REPLAY_CACHE_SIZE),
+        replay_store=args.replay_store,
+        replay_db=args.replay_db,
+        health_path=args.health_path,
+        dispatch_workers=parse_positive_int(args.dispatch_workers, DEFAULT_DISPATCH_WORKERS),
+        dispatch_queue_size=parse_positive_int(args.dispatch_queue_size, DEFAULT_DISPATCH_QUEUE_SIZE),
+        dispatch_retries=max(0, args.dispatch_retries),
+        workers=parse_positive_int(args.workers, DEFAULT_RELAY_WORKERS),
     )
 
-    slug_by_app_id, slug_by_bundle = load_catalog_maps(config.catalog_path)
+    if config.workers > 1 and not hasattr(socket, "SO_REUSEPORT"):
+        raise RuntimeError("--workers > 1 requires SO_REUSEPORT (Linux or BSD)")
+    if config.workers > 1 and config.replay_store == "memory":
+        print(
+            "[WARN] --replay-store memory keeps a separate replay cache per worker; "
+            "use --replay-store sqlite to suppress duplicates across workers"
+        )
 
+    # Loaded once before forking; workers only read the maps.
+    slug_by_app_id, slug_by_bundle = load_catalog_maps(config.catalog_path)
     RelayHandler.config = config
     RelayHandler.slug_by_app_id = slug_by_app_id
     RelayHandler.slug_by_bundle = slug_by_bundle
 
-    server = ThreadingHTTPServer((config.host, config.port), RelayHandler)
     print(
         json.dumps(
             {
@@ -532,17 +1199,119 @@ def main() -> int:
                 "catalog": str(config.catalog_path),
                 "mapped_apps": len(slug_by_app_id),
                 "signature_required": True,
+                "health": f"http://{config.host}:{config.port}{config.health_path}",
+                "workers": config.workers,
+                "dispatch_workers": config.dispatch_workers,
+                "dispatch_queue_size": config.dispatch_queue_size,
+                "replay_store": config.replay_store,
             },
             ensure_ascii=False,
         )
     )
 
+    if config.workers > 1:
+        return supervise_workers(config)
+    serve(config, ThreadingHTTPServer)
+    return 0
+
+
+def serve(config: RelayConfig, server_class: type[ThreadingHTTPServer]) -> None:
+    """Run one relay process until interrupted.
+
+    The replay store, dispatch threads and GitHub connections are created
+    here, after any fork, because none of them can be shared with a parent.
+    SIGTERM (systemd, ``docker stop``) stops the server like Ctrl-C so the
+    queued events are still dispatched before the process exits.
+    """
+    signal.signal(signal.SIGTERM, raise_keyboard_interrupt)
+    RelayHandler.replay_cache = open_replay_store(config)
+    dispatch_queue = DispatchQueue(
+        config,
+        on_drop=RelayHandler.forget_event,
+        on_dispatched=RelayHandler.mark_event_dispatched,
+    )
+    dispatch_queue.start()
+    RelayHandler.dispatch_queue = dispatch_queue
+
+    server = server_class((config.host, config.port), RelayHandler)
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         pass
     finally:
+        # A repeated SIGTERM must not cut the drain short.
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
         server.server_close()
+        dispatch_queue.stop()
+        RelayHandler.replay_cache.close()
+
+
+def raise_keyboard_interrupt(signum: int, frame: Any) -> None:
+    raise KeyboardInterrupt
+
+
+def spawn_worker(config: RelayConfig) -> int:
+    # Unflushed output would otherwise be written again by the child.
+    sys.stdout.flush()
+    pid = os.fork()
+    if pid:
+        return pid
+
+    code = 0
+    try:
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        print(f"[INFO] relay worker pid={os.getpid()} listening on {config.host}:{config.port}")
+        serve(config, ReusePortHTTPServer)
+    except BaseException as error:  # noqa: BLE001 - report and let the supervisor restart us
+        if not isinstance(error, KeyboardInterrupt):
+            print(f"[ERROR] relay worker pid={os.getpid()} crashed: {error!r}")
+            code = 1
+    finally:
+        sys.stdout.flush()
+        os._exit(code)
+
+
+def supervise_workers(config: RelayConfig) -> int:
+    """Pre-fork ``config.workers`` relay processes and restart any that exit."""
+    stopping = threading.Event()
+    workers: dict[int, float] = {}
+
+    def request_stop(signum: int, frame: Any) -> None:
+        stopping.set()
+        for pid in list(workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    # Move the catalog maps and config out of the collector's view so the
+    # forked workers do not dirty (and copy) those pages during GC passes.
+    gc.freeze()
+    for _ in range(config.workers):
+        workers[spawn_worker(config)] = time.monotonic()
+
+    backoff = WORKER_RESTART_BACKOFF_SECONDS
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started_at = workers.pop(pid, None)
+        if started_at is None or stopping.is_set():
+            continue
+
+        uptime = time.monotonic() - started_at
+        print(f"[WARN] relay worker pid={pid} exited (status={os.waitstatus_to_exitcode(status)}) after {uptime:.1f}s; restarting")
+        if uptime >= WORKER_STABLE_SECONDS:
+            backoff = WORKER_RESTART_BACKOFF_SECONDS
+        else:
+            if stopping.wait(backoff):
+                continue
+            backoff = min(WORKER_RESTART_BACKOFF_MAX_SECONDS, backoff * 2)
+        workers[spawn_worker(config)] = time.monotonic()
 
     return 0
 